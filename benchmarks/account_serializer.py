@@ -0,0 +1,95 @@
+"""
+Compare AccountSerializer with the precompiled serialize_accounts path.
+Runs in memory, no database needed.
+Usage: python -m benchmarks.account_serializer [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurantBE.settings.local")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from restaurantBE.accounts.models import Account  # noqa: E402
+from restaurantBE.accounts.serializers import (  # noqa: E402
+    ACCOUNT_FIELDS,
+    AccountSerializer,
+    serialize_accounts,
+)
+from restaurantBE.constants import Role  # noqa: E402
+
+
+def build_accounts(count):
+    now = timezone.now()
+    return [
+        Account(
+            id=index,
+            name=f"Employee {index}",
+            email=f"employee{index}@restaurant.vn",
+            avatar=None if index % 3 else f"https://cdn.example.com/{index}.png",
+            role=Role.EMPLOYEE,
+            create_at=now - timedelta(minutes=index),
+            update_at=now - timedelta(seconds=index),
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    accounts = build_accounts(args.rows)
+    rows = [{name: getattr(account, name) for name in ACCOUNT_FIELDS} for account in accounts]
+    renderer = JSONRenderer()
+
+    drf_time, drf_data = best_of(
+        args.repeat, lambda: AccountSerializer(accounts, many=True).data
+    )
+    instance_time, instance_data = best_of(args.repeat, lambda: serialize_accounts(accounts))
+    values_time, values_data = best_of(args.repeat, lambda: serialize_accounts(rows))
+
+    expected = renderer.render(drf_data)
+    if renderer.render(instance_data) != expected or renderer.render(values_data) != expected:
+        print("Output differs from AccountSerializer", file=sys.stderr)
+        return 1
+
+    print(f"rows: {args.rows}, best of {args.repeat}")
+    print(f"AccountSerializer        {drf_time * 1000:9.2f} ms")
+    print(
+        f"serialize_accounts(obj)  {instance_time * 1000:9.2f} ms"
+        f"  x{drf_time / instance_time:.1f}"
+    )
+    print(
+        f"serialize_accounts(rows) {values_time * 1000:9.2f} ms"
+        f"  x{drf_time / values_time:.1f}"
+    )
+    print("JSON output identical")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Import time report of the application start up: the load phases logged by
+restaurantBE.startup and, from python -X importtime, the time spent importing
+restaurantBE.settings, each restaurantBE app and each third party package.
+Every run is a fresh interpreter, the fastest run is reported.
+No database needed.
+Usage: python -m benchmarks.import_time [--module restaurantBE.wsgi] [--repeat 5] [--top 15] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+from restaurantBE import startup
+print(json.dumps({{
+    "total": (time.perf_counter() - started) * 1000,
+    "phases": startup.phases,
+}}))
+"""
+
+
+def group_of(name):
+    """
+    restaurantBE.settings, restaurantBE.<app> or the top level package.
+    """
+    parts = name.split(".")
+    if parts[0] == "restaurantBE" and len(parts) > 1:
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def run(module, settings):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    # "import time:      self [us] | cumulative | imported package"
+    groups = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        groups[group_of(name.strip())] += int(own)
+
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        "total": probe["total"],
+        "phases": dict(probe["phases"]),
+        "imports": {name: us / 1000 for name, us in groups.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="restaurantBE.wsgi")
+    parser.add_argument(
+        "--settings",
+        default=os.getenv("DJANGO_SETTINGS_MODULE", "restaurantBE.settings.production"),
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = min(
+        (run(args.module, args.settings) for _ in range(args.repeat)),
+        key=lambda result: result["total"],
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"import {args.module} ({args.settings}): {report['total']:.0f} ms")
+    print("\nLoad phases")
+    for name, duration in report["phases"].items():
+        print(f"  {name:<30} {duration:>8.1f} ms")
+
+    imports = sorted(report["imports"].items(), key=lambda item: -item[1])
+    own = [item for item in imports if item[0].startswith("restaurantBE")]
+    print("\nrestaurantBE modules (self time)")
+    for name, duration in own:
+        print(f"  {name:<30} {duration:>8.1f} ms")
+    print(f"\nPackages (self time, top {args.top})")
+    for name, duration in imports[: args.top]:
+        print(f"  {name:<30} {duration:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare DRF's JSONRenderer/JSONParser with the orjson pair on the response
+envelope, for a single account, a page of employees and a large list.
+Runs in memory, no database needed.
+Usage: python -m benchmarks.json_renderer [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import io
+import os
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurantBE.settings.local")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from benchmarks.account_serializer import best_of, build_accounts  # noqa: E402
+from restaurantBE.accounts.serializers import serialize_accounts  # noqa: E402
+from restaurantBE.utils.parsers import ORJSONParser  # noqa: E402
+from restaurantBE.utils.renderers import ORJSONRenderer  # noqa: E402
+from restaurantBE.utils.responses import apiSuccess  # noqa: E402
+
+
+def envelope(data):
+    return apiSuccess(data, "get_employees_success").data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    accounts = serialize_accounts(build_accounts(args.rows))
+    payloads = {
+        "account": envelope(accounts[0]),
+        "page of 10": envelope({"count": args.rows, "next": "abc", "results": accounts[:10]}),
+        f"{args.rows} rows": envelope(accounts),
+    }
+    drf_renderer, fast_renderer = JSONRenderer(), ORJSONRenderer()
+    drf_parser, fast_parser = JSONParser(), ORJSONParser()
+
+    print(f"best of {args.repeat}, times in ms")
+    print(f"{'payload':<14}{'render drf':>12}{'orjson':>10}{'parse drf':>12}{'orjson':>10}")
+    for name, data in payloads.items():
+        # Small payloads are timed over many calls
+        loops = max(1, 10000 // len(fast_renderer.render(data)) * 10)
+
+        def timed(func):
+            elapsed, result = best_of(args.repeat, lambda: [func() for _ in range(loops)])
+            return elapsed / loops * 1000, result[0]
+
+        drf_time, expected = timed(lambda: drf_renderer.render(data))
+        fast_time, content = timed(lambda: fast_renderer.render(data))
+        if content != expected:
+            print(f"{name}: output differs from JSONRenderer", file=sys.stderr)
+            return 1
+
+        drf_parse, parsed = timed(lambda: drf_parser.parse(io.BytesIO(content)))
+        fast_parse, fast_parsed = timed(lambda: fast_parser.parse(io.BytesIO(content)))
+        if parsed != fast_parsed:
+            print(f"{name}: parsed data differs from JSONParser", file=sys.stderr)
+            return 1
+
+        print(
+            f"{name:<14}{drf_time:>12.3f}{fast_time:>10.3f}"
+            f"{drf_parse:>12.3f}{fast_parse:>10.3f}"
+        )
+    print("JSON output identical")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
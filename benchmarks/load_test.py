@@ -0,0 +1,431 @@
+"""
+End to end load test of the auth and account flows. Every virtual user
+loops login -> me -> refresh token -> employee list -> logout with its own
+admin account, then throughput and p50/p95/p99 latency are reported per
+route (url names of restaurantBE/accounts/urls.py) and saved as JSON.
+--check-concurrency also fails the run when the server does not overlap
+requests: each request's server time (Server-Timing app;dur, sent with
+PROFILING_ENABLED=true) should be most of its latency, it drops to about
+1/concurrency when requests queue and are served one at a time, e.g. behind
+a sync-only middleware under ASGI. Use a --concurrency the server should
+take at once (workers x threads).
+Only needs a local server and database, e.g. a SQLite stand-in:
+
+    export DJANGO_SETTINGS_MODULE=restaurantBE.settings.loadtest LOADTEST_DATABASE=sqlite
+    python manage.py setup_database
+    python manage.py generate_synthetic_data --admins 20 --employees 10000
+    python -m benchmarks.load_test --spawn --concurrency 10 --duration 30
+    SERVER_MODE=asgi WEB_CONCURRENCY=1 python -m benchmarks.load_test --spawn --workers 1 \
+        --concurrency 8 --check-concurrency
+
+Usage: python -m benchmarks.load_test [--url http://127.0.0.1:8000 | --spawn]
+       [--concurrency 10] [--duration 30] [--output FILE] [--compare FILE]
+       [--check-concurrency [--min-server-share 0.5]]
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import platform
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurantBE.settings.loadtest")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.urls import reverse  # noqa: E402
+
+ROUTES = ["login", "get_user", "refresh_token", "get_employees", "logout"]
+PERCENTILES = [50, 95, 99]
+
+_APP_DURATION = re.compile(r"\bapp;dur=([\d.]+)")
+
+
+class Client:
+    """
+    One keep-alive connection per virtual user.
+    """
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.connection = None
+
+    def request(self, method, path, body=None, token=None):
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            body = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            try:
+                self.connection.request(method, path, body, headers)
+                response = self.connection.getresponse()
+                content = response.read()
+                if response.will_close:
+                    self.close()
+                return response.status, content, server_seconds(response)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server closed the idle keep-alive connection, retry once on a new one
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def server_seconds(response):
+    """
+    Time the server spent on the request, from ProfilingMiddleware's
+    Server-Timing header, None without it.
+    """
+    match = _APP_DURATION.search(response.getheader("Server-Timing") or "")
+    return float(match.group(1)) / 1000 if match else None
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        # route -> [latency, server time] of the requests with Server-Timing
+        self.server = defaultdict(lambda: [0.0, 0.0])
+        self.errors = defaultdict(int)
+        self.samples = {}
+        self.flows = 0
+        self.failed_flows = 0
+        # Set once every user has finished its warmup
+        self.started = None
+        self.deadline = None
+
+    def add(self, route, seconds, ok, detail=None, server=None):
+        with self.lock:
+            self.latencies[route].append(seconds)
+            if server is not None:
+                totals = self.server[route]
+                totals[0] += seconds
+                totals[1] += server
+            if not ok:
+                self.errors[route] += 1
+                self.samples.setdefault(route, detail)
+
+
+def call(client, recorder, record, route, method, path, body=None, token=None):
+    started = time.perf_counter()
+    try:
+        status, content, server = client.request(method, path, body, token)
+    except OSError as e:
+        status, content, server = None, str(e).encode(), None
+    elapsed = time.perf_counter() - started
+
+    ok = status is not None and 200 <= status < 300
+    if record:
+        recorder.add(
+            route, elapsed, ok, f"{status} {content[:200].decode(errors='replace')}", server
+        )
+    if not ok:
+        return None
+    return json.loads(content).get("data") or {}
+
+
+def flow(client, recorder, record, paths, email, password, page_size):
+    tokens = call(
+        client, recorder, record, "login", "POST", paths["login"],
+        {"email": email, "password": password},
+    )
+    if tokens is None:
+        return False
+    me = call(
+        client, recorder, record, "get_user", "GET", paths["get_user"], token=tokens["accessToken"]
+    )
+
+    refreshed = call(
+        client, recorder, record, "refresh_token", "POST", paths["refresh_token"],
+        {"refreshToken": tokens["refreshToken"]},
+    )
+    access = refreshed["accessToken"] if refreshed else tokens["accessToken"]
+    refresh = (refreshed or {}).get("refreshToken") or tokens["refreshToken"]
+
+    employees = call(
+        client, recorder, record, "get_employees", "GET",
+        f"{paths['get_employees']}?limit={page_size}", token=access,
+    )
+    logged_out = call(
+        client, recorder, record, "logout", "POST", paths["logout"],
+        {"refreshToken": refresh},
+    )
+    # A flow counts only when every step succeeded
+    return None not in (me, refreshed, employees, logged_out)
+
+
+def virtual_user(number, args, paths, recorder, warmed_up):
+    client = Client(args.url)
+    email = args.email.format(number)
+    try:
+        for _ in range(args.warmup):
+            flow(client, recorder, False, paths, email, args.password, args.page_size)
+        # Recording, and the throughput timer, start when every user is warm
+        warmed_up.wait()
+        while time.monotonic() < recorder.deadline:
+            ok = flow(client, recorder, True, paths, email, args.password, args.page_size)
+            with recorder.lock:
+                if ok:
+                    recorder.flows += 1
+                else:
+                    recorder.failed_flows += 1
+    except BaseException:
+        # Do not leave the other users waiting for this one
+        warmed_up.abort()
+        raise
+    finally:
+        client.close()
+
+
+def percentile(ordered, pct):
+    # Nearest rank
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(recorder, elapsed):
+    routes = {}
+    for route in ROUTES:
+        latencies = sorted(recorder.latencies.get(route, []))
+        if not latencies:
+            continue
+        stats = {
+            "requests": len(latencies),
+            "errors": recorder.errors.get(route, 0),
+            "rps": len(latencies) / elapsed,
+            "mean_ms": sum(latencies) / len(latencies) * 1000,
+            "max_ms": latencies[-1] * 1000,
+        }
+        for pct in PERCENTILES:
+            stats[f"p{pct}_ms"] = percentile(latencies, pct) * 1000
+        if route in recorder.server:
+            # Share of the latency the server was working on the request
+            latency, server = recorder.server[route]
+            stats["server_share"] = server / latency
+        routes[route] = stats
+    return routes
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def spawn_server(args):
+    """
+    gunicorn with gunicorn.conf.py on --url's port, returns once it accepts connections.
+    """
+    port = urlsplit(args.url).port or 80
+    env = dict(os.environ, PORT=str(port), WEB_CONCURRENCY=str(args.workers))
+    if args.check_concurrency:
+        # Server-Timing on every response
+        env.update(PROFILING_ENABLED="true", PROFILING_SAMPLE_RATE="1")
+    log = open(args.server_log, "w") if args.server_log else subprocess.DEVNULL
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py"],
+        env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"Server exited with code {server.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("Server did not start within 60s")
+
+
+def print_report(report, baseline=None):
+    meta = report["meta"]
+    print(
+        f"{meta['concurrency']} users, {report['elapsed_s']:.1f}s, "
+        f"{report['flows']} flows ({report['flows_per_s']:.1f}/s), "
+        f"{report['failed_flows']} failed, commit {meta['commit']}"
+    )
+    header = f"{'route':<16}{'requests':>9}{'errors':>8}{'req/s':>9}" + "".join(
+        f"{f'p{pct} ms':>10}" for pct in PERCENTILES
+    )
+    print(header + f"{'server':>8}")
+    for route, stats in report["routes"].items():
+        share = stats.get("server_share")
+        print(
+            f"{route:<16}{stats['requests']:>9}{stats['errors']:>8}{stats['rps']:>9.1f}"
+            + "".join(f"{stats[f'p{pct}_ms']:>10.1f}" for pct in PERCENTILES)
+            + (f"{share:>8.0%}" if share is not None else f"{'-':>8}")
+        )
+        before = (baseline or {}).get("routes", {}).get(route)
+        if before:
+            print(
+                f"{'  vs baseline':<33}{change(stats['rps'], before['rps']):>9}"
+                + "".join(
+                    f"{change(stats[f'p{pct}_ms'], before[f'p{pct}_ms']):>10}"
+                    for pct in PERCENTILES
+                )
+            )
+    for route, sample in report["error_samples"].items():
+        print(f"first {route} error: {sample}")
+
+
+def change(value, before):
+    if not before:
+        return "-"
+    return f"{(value - before) / before * 100:+.0f}%"
+
+
+def check_concurrency(report, min_share):
+    """
+    Routes whose requests the server spent less than min_share of their
+    latency on, i.e. that waited for other requests to finish.
+    """
+    shares = {
+        route: stats["server_share"]
+        for route, stats in report["routes"].items()
+        if "server_share" in stats
+    }
+    if not shares:
+        raise SystemExit(
+            "No Server-Timing in the responses, run the server with PROFILING_ENABLED=true"
+        )
+    return sorted(route for route, share in shares.items() if share < min_share)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="Start gunicorn on --url's port")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers with --spawn")
+    parser.add_argument("--server-log", default=None, help="gunicorn output with --spawn")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds")
+    parser.add_argument("--warmup", type=int, default=1, help="Unrecorded flows per user")
+    parser.add_argument(
+        "--email",
+        default="admin.42.{}@synthetic.test",
+        help="Account of virtual user N, see generate_synthetic_data (one admin per user)",
+    )
+    parser.add_argument("--password", default="secret!aa1")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--output", default=None, help="Default: benchmarks/results/<commit>-<time>.json")
+    parser.add_argument("--compare", default=None, help="Previous result to compare with")
+    parser.add_argument(
+        "--check-concurrency",
+        action="store_true",
+        help="Fail when the server serves concurrent requests one at a time",
+    )
+    parser.add_argument("--min-server-share", type=float, default=0.5)
+    args = parser.parse_args()
+
+    paths = {route: reverse(route) for route in ROUTES}
+    server = spawn_server(args) if args.spawn else None
+    try:
+        recorder = Recorder()
+
+        def start_recording():
+            recorder.started = time.monotonic()
+            recorder.deadline = recorder.started + args.duration
+
+        warmed_up = threading.Barrier(args.concurrency, action=start_recording)
+        users = [
+            threading.Thread(target=virtual_user, args=(number, args, paths, recorder, warmed_up))
+            for number in range(args.concurrency)
+        ]
+        for user in users:
+            user.start()
+        for user in users:
+            user.join()
+        if recorder.started is None:
+            raise SystemExit("A virtual user failed during warmup")
+        # Flows started before the deadline finish after it, count them in
+        elapsed = time.monotonic() - recorder.started
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    commit, dirty = git_revision()
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "url": args.url,
+            "settings": os.environ["DJANGO_SETTINGS_MODULE"],
+            "database": os.getenv("LOADTEST_DATABASE", "postgresql"),
+            "workers": args.workers if args.spawn else None,
+            "server_mode": os.getenv("SERVER_MODE", "wsgi"),
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "python": platform.python_version(),
+        },
+        "elapsed_s": elapsed,
+        "flows": recorder.flows,
+        "failed_flows": recorder.failed_flows,
+        "flows_per_s": recorder.flows / elapsed,
+        "routes": summarize(recorder, elapsed),
+        "error_samples": recorder.samples,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as source:
+            baseline = json.load(source)
+    print_report(report, baseline)
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"{commit or 'unknown'}-{int(time.time())}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as target:
+        json.dump(report, target, indent=2)
+    print(f"Saved {output}")
+
+    if args.check_concurrency:
+        queued = check_concurrency(report, args.min_server_share)
+        if queued:
+            raise SystemExit(
+                f"Requests to {', '.join(queued)} queued in the server: it spent less than "
+                f"{args.min_server_share:.0%} of their latency on them"
+            )
+        print(f"Concurrency check passed at {args.concurrency} concurrent users")
+
+
+if __name__ == "__main__":
+    main()
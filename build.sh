@@ -8,6 +8,9 @@ pip install -r requirements.txt
 # Collect static files
 python manage.py collectstatic --no-input
 
+# Prebuild the OpenAPI schema served at /docs/ (yaml is built on first request)
+python manage.py build_openapi --format json
+
 # Run migrations
 python manage.py migrate
 
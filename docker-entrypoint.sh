@@ -1,13 +1,16 @@
 #!/bin/bash
+# ./docker-entrypoint.sh setup  migrate and seed the database, then exit
+# ./docker-entrypoint.sh        start gunicorn, running the setup first
+#                               unless FAST_START=true (setup is a separate job)
 
-echo "Make migrations"
-python manage.py makemigrations
+if [ "$1" = "setup" ]; then
+    exec python manage.py setup_database
+fi
 
-echo "Apply database migrations"
-python manage.py migrate
-
-echo "Seed database"
-python manage.py loaddata restaurantBE/database/seed.json || echo "Seed data not found or already loaded"
+if [ "${FAST_START:-false}" != "true" ]; then
+    echo "Set up database"
+    python manage.py setup_database || echo "Database setup failed"
+fi
 
 echo "Starting server on port ${PORT:-80}"
-gunicorn --bind 0.0.0.0:${PORT:-80} --access-logfile - --error-logfile - restaurantBE.wsgi
+exec gunicorn --config gunicorn.conf.py
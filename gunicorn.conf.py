@@ -0,0 +1,68 @@
+"""
+Gunicorn configuration, read automatically from the working directory
+SERVER_MODE=wsgi  sync workers, or threaded workers when GUNICORN_THREADS > 1
+SERVER_MODE=asgi  uvicorn workers serving restaurantBE.asgi (async views)
+GUNICORN_PRELOAD=true (default with FAST_START=true) loads the application once
+in the master, workers are forked from it and share its memory copy-on-write
+"""
+
+import gc
+import glob
+import os
+import time
+
+started = time.perf_counter()
+
+server_mode = os.getenv("SERVER_MODE", "wsgi")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '80')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+accesslog = "-"
+errorlog = "-"
+
+preload_app = (
+    os.getenv("GUNICORN_PRELOAD", os.getenv("FAST_START", "false")).lower() == "true"
+)
+# Read by restaurantBE.startup to leave the background threads to post_fork
+os.environ["GUNICORN_PRELOAD"] = "true" if preload_app else "false"
+
+if server_mode == "asgi":
+    wsgi_app = "restaurantBE.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    wsgi_app = "restaurantBE.wsgi:application"
+    threads = int(os.getenv("GUNICORN_THREADS", "1"))
+    worker_class = "gthread" if threads > 1 else "sync"
+
+
+def on_starting(server):
+    # Worker metric snapshots of a previous run (see restaurantBE/metrics)
+    metrics_dir = os.getenv("METRICS_DIR")
+    if metrics_dir:
+        for path in glob.glob(os.path.join(metrics_dir, "*.json")):
+            os.remove(path)
+
+
+def when_ready(server):
+    if preload_app:
+        from django.db import connections
+
+        # Nothing the master opened may be shared with the workers, and
+        # objects loaded so far stay out of the collector so its bookkeeping
+        # does not copy their pages into every worker
+        connections.close_all()
+        gc.freeze()
+    server.log.info(
+        "Master ready in %.0fms (preload_app=%s)",
+        (time.perf_counter() - started) * 1000,
+        preload_app,
+    )
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from restaurantBE.startup import start_background_tasks
+
+        start_background_tasks()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'restaurantBE.accounts'
+
+    def ready(self):
+        from restaurantBE.accounts import signals  # noqa: F401
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from restaurantBE.accounts.services import compact_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted tokens in small batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--max-batches", type=int, default=None)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        total = 0
+
+        batches = compact_expired_tokens(
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            pause=options["pause"],
+        )
+        for number, (removed, elapsed) in enumerate(batches, start=1):
+            total += removed
+            self.stdout.write(f"Batch {number}: removed {removed} rows in {elapsed:.3f}s")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Removed {total} rows in {time.monotonic() - started:.3f}s"
+            )
+        )
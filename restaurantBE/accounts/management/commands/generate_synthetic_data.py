@@ -0,0 +1,233 @@
+import random
+import time
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from restaurantBE.accounts.models import Account
+from restaurantBE.constants import Role
+from restaurantBE.constants.roles import TableStatus
+from restaurantBE.guests.models import Guest
+from restaurantBE.tables.models import Table
+
+FIRST_NAMES = [
+    "An", "Binh", "Chi", "Dung", "Giang", "Hai", "Hoa", "Khanh", "Lan", "Linh",
+    "Long", "Mai", "Minh", "Nam", "Ngoc", "Phuong", "Quan", "Thao", "Trang", "Tuan",
+]
+LAST_NAMES = [
+    "Nguyen", "Tran", "Le", "Pham", "Hoang", "Huynh", "Phan", "Vu", "Vo", "Dang",
+]
+TABLE_STATUSES = [TableStatus.AVAILABLE] * 8 + [TableStatus.RESERVED, TableStatus.HIDDEN]
+TABLE_CAPACITIES = [2, 2, 4, 4, 4, 6, 8, 10]
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def random_hex(rng, bits=128):
+    return f"{rng.getrandbits(bits):0{bits // 4}x}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk generate synthetic accounts, tables, guests and refresh tokens for load "
+        "testing. The same --seed always generates the same rows (table tokens included), "
+        "never run it against a production database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--admins", type=int, default=10, help="Restaurant owners")
+        parser.add_argument(
+            "--employees", type=int, default=1000, help="Employees, spread over the admins"
+        )
+        parser.add_argument("--tables", type=int, default=100)
+        parser.add_argument("--table-start", type=int, default=1, help="First table number")
+        parser.add_argument("--guests", type=int, default=1000)
+        parser.add_argument(
+            "--tokens", type=int, default=1000, help="Outstanding refresh tokens"
+        )
+        parser.add_argument(
+            "--blacklisted",
+            type=float,
+            default=0.2,
+            help="Share of the outstanding tokens that are blacklisted",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Tokens and guests are issued over the last DAYS days, so part are expired",
+        )
+        parser.add_argument("--password", default="secret!aa1", help="Password of every account")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now()
+        self.window = timedelta(days=options["days"]).total_seconds()
+        seed = options["seed"]
+
+        # One hash for every account, hashing millions of passwords would take hours
+        password = make_password(options["password"])
+
+        admin_emails = [f"admin.{seed}.{i}@synthetic.test" for i in range(options["admins"])]
+        self.create(
+            "admins",
+            Account,
+            (
+                Account(email=email, name=self.name(), password=password, role=Role.ADMIN)
+                for email in admin_emails
+            ),
+            options["admins"],
+        )
+        # Ordered, so rng.choice() picks the same owners for the same seed
+        owner_ids = list(
+            Account.objects.filter(email__in=admin_emails)
+            .order_by("id")
+            .values_list("id", flat=True)
+        ) or [None]
+
+        self.create(
+            "employees",
+            Account,
+            (
+                Account(
+                    email=f"employee.{seed}.{i}@synthetic.test",
+                    name=self.name(),
+                    password=password,
+                    role=Role.EMPLOYEE,
+                    owner_id=self.rng.choice(owner_ids),
+                )
+                for i in range(options["employees"])
+            ),
+            options["employees"],
+        )
+
+        numbers = range(options["table_start"], options["table_start"] + options["tables"])
+        self.create(
+            "tables",
+            Table,
+            (
+                Table(
+                    number=number,
+                    capacity=self.rng.choice(TABLE_CAPACITIES),
+                    status=self.rng.choice(TABLE_STATUSES),
+                    token=random_hex(self.rng),
+                )
+                for number in numbers
+            ),
+            options["tables"],
+        )
+
+        if numbers:
+            guest_lifetime = settings.GUEST_REFRESH_TOKEN_LIFETIME
+            self.create(
+                "guests",
+                Guest,
+                (
+                    Guest(
+                        name=self.name(),
+                        tableNumber_id=self.rng.choice(numbers),
+                        refeshToken=random_hex(self.rng),
+                        refreshTokenExpiryAt=self.issued_at() + guest_lifetime,
+                    )
+                    for _ in range(options["guests"])
+                ),
+                options["guests"],
+            )
+
+        self.create_tokens(options["tokens"], options["blacklisted"], seed)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated data in {time.monotonic() - started:.1f}s")
+        )
+
+    def name(self):
+        return f"{self.rng.choice(LAST_NAMES)} {self.rng.choice(FIRST_NAMES)}"
+
+    def issued_at(self):
+        return self.now - timedelta(seconds=self.rng.uniform(0, self.window))
+
+    def create(self, label, model, objects, total):
+        """
+        bulk_create objects in batches, rows that already exist (same seed) are skipped.
+        """
+        started = time.monotonic()
+        done = 0
+        for batch in chunked(objects, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(batch, ignore_conflicts=True)
+            done += len(batch)
+            self.progress(label, done, total, started)
+        self.stdout.write("")
+
+    def progress(self, label, done, total, started):
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            f"\r{label}: {done}/{total} rows, {done / max(elapsed, 1e-6):.0f} rows/s", ending=""
+        )
+        self.stdout.flush()
+
+    def create_tokens(self, total, blacklisted, seed):
+        """
+        Outstanding refresh tokens of the synthetic accounts, the token text is
+        filler of the length of a real token, only jti and expires_at are used.
+        """
+        user_ids = list(
+            Account.objects.filter(
+                email__endswith="@synthetic.test", email__contains=f".{seed}."
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if not user_ids or not total:
+            return
+
+        lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"]
+        filler = "x" * len(str(RefreshToken()))
+        started = time.monotonic()
+        done = 0
+        for batch in chunked(range(total), self.batch_size):
+            tokens = []
+            for _ in batch:
+                jti = random_hex(self.rng)
+                created_at = self.issued_at()
+                tokens.append(
+                    OutstandingToken(
+                        user_id=self.rng.choice(user_ids),
+                        jti=jti,
+                        token=filler,
+                        created_at=created_at,
+                        expires_at=created_at + lifetime,
+                    )
+                )
+            revoked = [token.jti for token in tokens if self.rng.random() < blacklisted]
+
+            with transaction.atomic():
+                OutstandingToken.objects.bulk_create(tokens, ignore_conflicts=True)
+                # ignore_conflicts leaves the primary keys unset
+                ids = OutstandingToken.objects.filter(jti__in=revoked).values_list(
+                    "id", flat=True
+                )
+                BlacklistedToken.objects.bulk_create(
+                    [BlacklistedToken(token_id=pk) for pk in ids], ignore_conflicts=True
+                )
+            done += len(tokens)
+            self.progress("tokens", done, total, started)
+        self.stdout.write("")
@@ -0,0 +1,95 @@
+import os
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection
+from django.db.migrations.executor import MigrationExecutor
+
+# Any constant shared by the setup jobs of one database
+SETUP_LOCK_ID = 7243501
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply pending migrations and load the seed fixture into an empty database, "
+        "safe to run on every deploy"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fixture",
+            default=os.path.join(settings.BASE_DIR, "database", "seed.json"),
+            help="Seed fixture, loaded only when there is no account yet",
+        )
+        parser.add_argument("--no-seed", action="store_true")
+        parser.add_argument(
+            "--wait",
+            type=float,
+            default=30,
+            help="Seconds to wait for the database to accept connections",
+        )
+
+    @contextmanager
+    def phase(self, name):
+        started = time.monotonic()
+        yield
+        self.stdout.write(f"{name}: {time.monotonic() - started:.3f}s")
+
+    @contextmanager
+    def lock(self):
+        # Concurrent jobs (several replicas starting together) wait for each other
+        if connection.vendor != "postgresql":
+            yield
+            return
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [SETUP_LOCK_ID])
+            try:
+                yield
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [SETUP_LOCK_ID])
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+
+        with self.phase("connect"):
+            self.connect(options["wait"])
+
+        with self.lock():
+            with self.phase("migrate"):
+                executor = MigrationExecutor(connection)
+                plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+                if plan:
+                    call_command("migrate", interactive=False, verbosity=options["verbosity"])
+                else:
+                    self.stdout.write("No migrations to apply")
+
+            if not options["no_seed"]:
+                with self.phase("seed"):
+                    self.seed(options["fixture"], options["verbosity"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Database ready in {time.monotonic() - started:.3f}s")
+        )
+
+    def connect(self, wait):
+        deadline = time.monotonic() + wait
+        while True:
+            try:
+                connection.ensure_connection()
+                return
+            except OperationalError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(1)
+
+    def seed(self, fixture, verbosity):
+        if not os.path.exists(fixture):
+            self.stdout.write(f"No seed fixture at {fixture}")
+        elif get_user_model().objects.exists():
+            self.stdout.write("Database already seeded")
+        else:
+            call_command("loaddata", fixture, verbosity=verbosity)
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.14 on 2026-10-18 13:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_account_role'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='tokens_valid_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
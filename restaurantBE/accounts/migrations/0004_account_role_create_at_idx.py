@@ -0,0 +1,17 @@
+# Generated by Django 3.2.14 on 2026-10-18 13:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_account_tokens_valid_after'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['role', '-create_at', '-id'], name='account_role_create_at_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.14 on 2026-10-18 14:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_account_role_create_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['role', 'update_at'], name='account_role_update_at_idx'),
+        ),
+    ]
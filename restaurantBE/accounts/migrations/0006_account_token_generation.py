@@ -0,0 +1,22 @@
+# Generated by Django 3.2.14 on 2026-10-18 14:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_account_role_update_at_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='account',
+            name='tokens_valid_after',
+        ),
+        migrations.AddField(
+            model_name='account',
+            name='token_generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.14 on 2026-10-18 14:49
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_account_token_generation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmployeeImportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('PENDING', 'pending'), ('DONE', 'completed'), ('FAILED', 'failed')], default='PENDING', max_length=20)),
+                ('total', models.PositiveIntegerField()),
+                ('count', models.PositiveIntegerField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('create_at', models.DateTimeField(auto_now_add=True)),
+                ('update_at', models.DateTimeField(auto_now=True)),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'EmployeeImportJob',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.14 on 2026-10-18 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_employeeimportjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employeeimportjob',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'pending'), ('RUNNING', 'running'), ('DONE', 'completed'), ('FAILED', 'failed')], default='PENDING', max_length=20),
+        ),
+    ]
@@ -1,3 +1,6 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.contrib.auth.hashers import make_password
@@ -25,6 +28,7 @@ class AccountManager(BaseUserManager):
 
 
 from restaurantBE.constants import Role
+from restaurantBE.constants.roles import ImportStatus
 
 
 class Account(AbstractUser):
@@ -41,6 +45,8 @@ class Account(AbstractUser):
     )
     avatar = models.CharField(max_length=255, blank=True, null=True)
     owner_id = models.IntegerField(blank=True, null=True)
+    # Bumped on logout, access tokens carrying an older "gen" claim are rejected
+    token_generation = models.PositiveIntegerField(default=0)
     create_at = models.DateTimeField(auto_now_add=True)
     update_at = models.DateTimeField(auto_now=True)
 
@@ -50,6 +56,40 @@ class Account(AbstractUser):
 
     class Meta:
         db_table = "Account"
+        indexes = [
+            # Keyset pagination of the employee list
+            models.Index(
+                fields=["role", "-create_at", "-id"], name="account_role_create_at_idx"
+            ),
+            # Max(update_at) validator of the employee list
+            models.Index(fields=["role", "update_at"], name="account_role_update_at_idx"),
+        ]
 
     def __str__(self):
         return self.email
+
+
+class EmployeeImportJob(models.Model):
+    """
+    Employee import run in the background, see services.submit_import.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    status = models.CharField(
+        max_length=20, choices=ImportStatus.choices, default=ImportStatus.PENDING
+    )
+    total = models.PositiveIntegerField()
+    # Accounts created, once DONE
+    count = models.PositiveIntegerField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+    create_at = models.DateTimeField(auto_now_add=True)
+    update_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "EmployeeImportJob"
+
+    def __str__(self):
+        return f"Employee import {self.id} ({self.status})"
@@ -3,11 +3,19 @@ from .auth import (
     LoginSerializer,
 )
 from .accounts import (
+    ACCOUNT_FIELDS,
     AccountSerializer,
+    serialize_account,
+    serialize_accounts,
 )
+from .employees import EmployeeImportSerializer
 
 __all__ = [
     "RegisterSerializer",
     "AccountSerializer",
     "LoginSerializer",
+    "ACCOUNT_FIELDS",
+    "serialize_account",
+    "serialize_accounts",
+    "EmployeeImportSerializer",
 ]
@@ -1,5 +1,9 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
 from rest_framework import serializers
 from restaurantBE.accounts.models import Account
+from restaurantBE.utils.profiling import timed
 
 
 class AccountSerializer(serializers.ModelSerializer):
@@ -7,3 +11,52 @@ class AccountSerializer(serializers.ModelSerializer):
         model = Account
         fields = ("id", "name", "email", "avatar", "role", "create_at", "update_at")
         read_only_fields = ("id", "role", "create_at", "update_at")
+
+
+ACCOUNT_FIELDS = AccountSerializer.Meta.fields
+
+# (name, is_datetime) for every output field, resolved once at import
+_ACCOUNT_PLAN = tuple(
+    (name, isinstance(Account._meta.get_field(name), models.DateTimeField))
+    for name in ACCOUNT_FIELDS
+)
+
+
+def format_datetime(value, tz):
+    """
+    Same output as rest_framework.fields.DateTimeField with ISO_8601, in tz.
+    """
+    if not value:
+        return None
+    if tz is not None:
+        value = value.astimezone(tz)
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def serialize_accounts(rows):
+    """
+    Read-only equivalent of AccountSerializer(rows, many=True).data, for
+    Account instances or Account.objects.values(*ACCOUNT_FIELDS) rows.
+    Renders to the same JSON bytes without DRF's per-field machinery.
+    """
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+    data = []
+    with timed("serialize"):
+        for row in rows:
+            get = row.get if isinstance(row, dict) else row.__getattribute__
+            item = {}
+            for name, is_datetime in _ACCOUNT_PLAN:
+                value = get(name)
+                item[name] = format_datetime(value, tz) if is_datetime else value
+            data.append(item)
+    return data
+
+
+def serialize_account(instance):
+    """
+    Read-only equivalent of AccountSerializer(instance).data.
+    """
+    return serialize_accounts((instance,))[0]
@@ -8,7 +8,7 @@ from rest_framework_simplejwt.serializers import (
 )
 from rest_framework import serializers
 from django.utils.translation import gettext as _
-from restaurantBE.accounts.serializers.accounts import AccountSerializer
+from restaurantBE.accounts.serializers.accounts import serialize_account
 
 
 from restaurantBE.constants import Role
@@ -68,6 +68,8 @@ class LoginSerializer(TokenObtainPairSerializer):
         # Add custom claims
         token["user_id"] = user.id
         token["role"] = user.role
+        # Copied into the access tokens, see is_token_revoked
+        token["gen"] = user.token_generation
 
         return token
 
@@ -77,7 +79,7 @@ class LoginSerializer(TokenObtainPairSerializer):
         return {
             "accessToken": data["access"],
             "refreshToken": data["refresh"],
-            "account": AccountSerializer(self.user).data,
+            "account": serialize_account(self.user),
         }
 
 
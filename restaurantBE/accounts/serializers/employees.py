@@ -0,0 +1,37 @@
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+
+from restaurantBE.accounts.serializers.auth import RegisterSerializer
+from restaurantBE.accounts.services import find_existing_emails
+
+
+class EmployeeImportListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        # One query for the emails of every row instead of one per row
+        emails = set()
+        if isinstance(data, list):
+            emails = {
+                str(row.get("email", "")).lower() for row in data if isinstance(row, dict)
+            }
+        self.taken_emails = find_existing_emails(emails) if emails else set()
+        self.seen_emails = set()
+        return super().to_internal_value(data)
+
+
+class EmployeeImportSerializer(RegisterSerializer):
+    """
+    One row of a bulk employee import, errors are reported per row.
+    """
+
+    class Meta(RegisterSerializer.Meta):
+        fields = ("email", "name", "password", "avatar")
+        list_serializer_class = EmployeeImportListSerializer
+
+    def validate_email(self, value):
+        value = value.lower()
+        if value in self.parent.taken_emails:
+            raise serializers.ValidationError(_("email_exists"))
+        if value in self.parent.seen_emails:
+            raise serializers.ValidationError(_("email_duplicated"))
+        self.parent.seen_emails.add(value)
+        return value
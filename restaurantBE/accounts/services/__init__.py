@@ -0,0 +1,39 @@
+"""
+Export all services from submodules
+Usage: from restaurantBE.accounts.services import revoke_user_tokens
+"""
+
+from .accounts import (
+    get_cached_account,
+    invalidate_account,
+)
+from .employees import (
+    find_existing_emails,
+    import_employees,
+    iter_employees_csv,
+    submit_import,
+)
+from .tokens import (
+    revoke_user_tokens,
+    is_token_revoked,
+    compact_expired_tokens,
+    run_token_compaction,
+    start_token_compaction,
+)
+
+__all__ = [
+    # Accounts
+    "get_cached_account",
+    "invalidate_account",
+    # Employees
+    "find_existing_emails",
+    "import_employees",
+    "iter_employees_csv",
+    "submit_import",
+    # Tokens
+    "revoke_user_tokens",
+    "is_token_revoked",
+    "compact_expired_tokens",
+    "run_token_compaction",
+    "start_token_compaction",
+]
@@ -0,0 +1,76 @@
+"""
+Account Services
+Handles: In-process cache of account rows used by authentication
+"""
+
+import time
+
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+from restaurantBE.accounts.models import Account
+from restaurantBE.utils.cache import bump_version, get_version
+
+ACCOUNT_CACHE_ALIAS = "accounts"
+
+_FIELD_NAMES = [field.attname for field in Account._meta.concrete_fields]
+_ROLE = _FIELD_NAMES.index("role")
+_TOKEN_GENERATION = _FIELD_NAMES.index("token_generation")
+
+
+def _cache_key(user_id):
+    return f"account:{user_id}"
+
+
+def _version_key(user_id):
+    return f"account:{user_id}:version"
+
+
+def _is_stale(loaded_at, row, claims):
+    # A row loaded before the token was issued may predate the role and
+    # token_generation the token carries. Rows loaded later are trusted: the
+    # token is then the older one (a revoked token or a changed role).
+    if claims is None or loaded_at >= claims.get("iat", 0):
+        return False
+    return (
+        claims.get("role", row[_ROLE]) != row[_ROLE]
+        or claims.get("gen", 0) != row[_TOKEN_GENERATION]
+    )
+
+
+def get_cached_account(user_id, claims=None):
+    """
+    Return an Account instance for user_id from the in-process cache, None
+    when the account does not exist. The cached row is reloaded when its
+    shared version moved (another process wrote the account), when claims
+    (the token's role and gen) are newer than it, or after the cache TTL.
+    Every call returns a fresh instance, so callers may modify and save it.
+    """
+    cache = caches[ACCOUNT_CACHE_ALIAS]
+    key = _cache_key(user_id)
+    version = get_version(_version_key(user_id))
+
+    entry = cache.get(key)
+    if entry is not None:
+        cached_version, loaded_at, row = entry
+        if cached_version != version or _is_stale(loaded_at, row, claims):
+            entry = None
+
+    if entry is None:
+        loaded_at = time.time()
+        row = Account.objects.filter(pk=user_id).values_list(*_FIELD_NAMES).first()
+        if row is None:
+            return None
+        cache.set(key, (version, loaded_at, row))
+
+    return Account.from_db(DEFAULT_DB_ALIAS, _FIELD_NAMES, row)
+
+
+def invalidate_account(user_id):
+    """
+    Drop the cached row of user_id in every process. Called from the Account
+    signals and by code paths that write through QuerySet.update(), which
+    sends no signal.
+    """
+    caches[ACCOUNT_CACHE_ALIAS].delete(_cache_key(user_id))
+    bump_version(_version_key(user_id))
@@ -0,0 +1,134 @@
+"""
+Employee bulk import and export
+Passwords of an import are hashed in a process pool, accounts are then
+written with bulk_create. Large imports run on a background thread, job
+state lives in EmployeeImportJob so any worker process can answer a poll.
+"""
+
+import csv
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from restaurantBE.accounts.models import Account, EmployeeImportJob
+from restaurantBE.constants import Role
+from restaurantBE.constants.roles import ImportStatus
+from restaurantBE.utils.hashing import hash_passwords
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_executor = None
+_slots = None
+
+
+def find_existing_emails(emails):
+    """
+    The subset of emails that already have an account, in one query.
+    """
+    return set(
+        Account.objects.filter(email__in=list(emails)).values_list("email", flat=True)
+    )
+
+
+def import_employees(rows):
+    """
+    Create EMPLOYEE accounts from validated rows (email, name, password and
+    optionally avatar) and return them. Emails must already be checked.
+    """
+    hashes = hash_passwords(row["password"] for row in rows)
+    accounts = [
+        Account(
+            email=row["email"],
+            name=row["name"],
+            avatar=row.get("avatar") or None,
+            role=Role.EMPLOYEE,
+            password=password,
+        )
+        for row, password in zip(rows, hashes)
+    ]
+
+    with transaction.atomic():
+        return Account.objects.bulk_create(
+            accounts, batch_size=settings.EMPLOYEE_IMPORT_BATCH_SIZE
+        )
+
+
+def _get_pool():
+    global _executor, _slots
+    with _lock:
+        if _executor is None:
+            # One import at a time, its passwords already use every hashing process
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="employee-import")
+            _slots = threading.BoundedSemaphore(settings.EMPLOYEE_IMPORT_MAX_PENDING)
+    return _executor, _slots
+
+
+def submit_import(job, rows):
+    """
+    Queue import_employees(rows) for job. Returns False, without queueing,
+    when EMPLOYEE_IMPORT_MAX_PENDING imports are already waiting or running.
+    """
+    executor, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        return False
+
+    try:
+        executor.submit(_run_import, job.pk, rows)
+    except Exception:
+        slots.release()
+        raise
+    return True
+
+
+def _run_import(job_id, rows):
+    try:
+        EmployeeImportJob.objects.filter(pk=job_id).update(
+            status=ImportStatus.RUNNING, update_at=timezone.now()
+        )
+        accounts = import_employees(rows)
+        EmployeeImportJob.objects.filter(pk=job_id).update(
+            status=ImportStatus.DONE, count=len(accounts), update_at=timezone.now()
+        )
+    except IntegrityError:
+        # An email was taken between the check and the insert
+        EmployeeImportJob.objects.filter(pk=job_id).update(
+            status=ImportStatus.FAILED, error="email_exists", update_at=timezone.now()
+        )
+    except Exception as e:
+        logger.exception("Employee import job %s failed", job_id)
+        EmployeeImportJob.objects.filter(pk=job_id).update(
+            status=ImportStatus.FAILED, error=str(e), update_at=timezone.now()
+        )
+    finally:
+        _slots.release()
+        close_old_connections()
+
+
+class _Echo:
+    # csv.writer target that hands each formatted line back
+    def write(self, value):
+        return value
+
+
+def iter_employees_csv(queryset, fields, chunk_size=1000):
+    """
+    Yield the queryset as CSV lines, header first, reading chunk_size rows
+    per database round trip. Datetimes are written like the JSON API renders
+    them, in the current time zone.
+    """
+    from restaurantBE.accounts.serializers.accounts import format_datetime
+
+    tz = timezone.get_current_timezone() if settings.USE_TZ else None
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        yield writer.writerow(
+            format_datetime(value, tz) if isinstance(value, datetime) else value
+            for value in row
+        )
@@ -0,0 +1,158 @@
+"""
+Token Services
+Handles: Bulk revocation of a user's tokens, access token generation,
+         Compaction of expired tokens
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    OutstandingToken,
+    BlacklistedToken,
+)
+from restaurantBE.accounts.models import Account
+from restaurantBE.accounts.services.accounts import invalidate_account
+
+logger = logging.getLogger(__name__)
+
+# Any constant shared by the compaction passes of one database
+COMPACTION_LOCK_ID = 7243502
+
+
+def revoke_user_tokens(user_id):
+    """
+    Blacklist every live outstanding token of a user in a single
+    INSERT ... SELECT, so the cost does not depend on login history.
+    Expired and already blacklisted tokens are skipped, rows blacklisted
+    by a concurrent logout are ignored instead of failing the insert.
+    Access tokens are not stored, they are revoked by bumping the user's
+    token_generation.
+    Returns the number of refresh tokens revoked.
+    """
+    qn = connection.ops.quote_name
+    outstanding = qn(OutstandingToken._meta.db_table)
+    blacklisted = qn(BlacklistedToken._meta.db_table)
+
+    # INSERT OR IGNORE on SQLite, ON CONFLICT DO NOTHING on PostgreSQL
+    sql = (
+        f"{connection.ops.insert_statement(ignore_conflicts=True)} "
+        f"{blacklisted} ({qn('token_id')}, {qn('blacklisted_at')}) "
+        f"SELECT o.{qn('id')}, %s FROM {outstanding} o "
+        f"WHERE o.{qn('user_id')} = %s AND o.{qn('expires_at')} > %s "
+        f"AND NOT EXISTS (SELECT 1 FROM {blacklisted} b "
+        f"WHERE b.{qn('token_id')} = o.{qn('id')}) "
+        f"{connection.ops.ignore_conflicts_suffix_sql(ignore_conflicts=True)}"
+    )
+    now = timezone.now()
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, [now, user_id, now])
+        revoked = cursor.rowcount
+        Account.objects.filter(pk=user_id).update(
+            token_generation=F("token_generation") + 1
+        )
+    invalidate_account(user_id)
+    return revoked
+
+
+def is_token_revoked(user, token):
+    """
+    Whether a token was issued for an older token_generation of the user,
+    i.e. before a logout. Tokens without the claim belong to generation 0.
+    """
+    return token.get("gen", 0) != user.token_generation
+
+
+def compact_expired_tokens(batch_size=1000, max_batches=None, pause=0):
+    """
+    Delete expired outstanding tokens (and their blacklist rows) in batches
+    of at most batch_size, walking the primary key so every batch is a short
+    transaction. Yields (rows_removed, seconds) for each batch.
+    """
+    cutoff = timezone.now()
+    last_id = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=cutoff, id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+
+        started = time.monotonic()
+        with transaction.atomic():
+            removed = BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            removed += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+        yield removed, time.monotonic() - started
+
+        last_id = ids[-1]
+        batches += 1
+        if pause:
+            time.sleep(pause)
+
+
+@contextmanager
+def compaction_lock():
+    """
+    Session advisory lock taken without waiting, so one process of all the
+    workers and replicas compacts at a time. Yields whether it was acquired,
+    always True off PostgreSQL.
+    """
+    if connection.vendor != "postgresql":
+        yield True
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", [COMPACTION_LOCK_ID])
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [COMPACTION_LOCK_ID])
+
+
+def run_token_compaction(batch_size=1000):
+    """
+    One compaction pass under compaction_lock(). Returns the number of rows
+    removed, None when another process holds the lock.
+    """
+    with compaction_lock() as acquired:
+        if not acquired:
+            return None
+        return sum(rows for rows, _ in compact_expired_tokens(batch_size))
+
+
+def start_token_compaction(interval, batch_size=1000):
+    """
+    Run a compaction pass every interval seconds in a daemon thread of the
+    current process. Every worker starts one, the passes of the workers that
+    miss the advisory lock are skipped. Returns the thread.
+    """
+
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                removed = run_token_compaction(batch_size)
+                if removed is None:
+                    logger.debug("Token compaction running in another process, skipped")
+                else:
+                    logger.info("Token compaction removed %s rows", removed)
+            except Exception:
+                logger.exception("Token compaction failed")
+            finally:
+                close_old_connections()
+
+    thread = threading.Thread(target=run, name="token-compaction", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,364 @@
+import asyncio
+import csv
+import io
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth.hashers import check_password
+from django.http import HttpResponse
+from django.test import AsyncClient, SimpleTestCase, TestCase, override_settings
+from django.urls import path, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from restaurantBE.accounts.models import Account, EmployeeImportJob
+from restaurantBE.accounts.services import (
+    accounts,
+    compact_expired_tokens,
+    employees,
+    run_token_compaction,
+)
+from restaurantBE.constants import Role
+from restaurantBE.constants.roles import ImportStatus
+from restaurantBE.utils import hashing
+from restaurantBE.utils.async_views import ASGIHandler, StreamingResponse, asgi_view
+from restaurantBE.utils.cache import bump_version
+
+_meeting = threading.Barrier(2, timeout=5)
+_released = threading.Event()
+
+
+def _meet(request):
+    # Only returns once two requests are in the view at the same time
+    _meeting.wait()
+    return HttpResponse()
+
+
+def _stream(request):
+    def parts():
+        yield b"head,"
+        # Released by a coroutine, i.e. only while the event loop is free
+        if not _released.wait(5):
+            raise RuntimeError("event loop blocked")
+        yield b"rest"
+
+    return StreamingResponse(parts())
+
+
+with override_settings(ASYNC_VIEWS=True):
+    urlpatterns = [path("meet/", asgi_view(_meet)), path("stream/", asgi_view(_stream))]
+
+
+class LogoutRevocationTests(TestCase):
+    """
+    Logout revokes the access tokens issued before it, even within the same
+    second (iat only has whole seconds).
+    """
+
+    password = "secret!aa1"
+
+    def setUp(self):
+        self.account = Account.objects.create_user(
+            "admin@restaurant.vn", "Admin", self.password, role=Role.ADMIN
+        )
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post(
+            reverse("login"),
+            {"email": self.account.email, "password": self.password},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["data"]
+
+    def get_me(self, access):
+        return self.client.get(reverse("get_user"), HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def logout(self, refresh):
+        response = self.client.post(reverse("logout"), {"refreshToken": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_old_access_token_rejected_after_logout(self):
+        for _ in range(3):
+            tokens = self.login()
+            self.assertEqual(self.get_me(tokens["accessToken"]).status_code, status.HTTP_200_OK)
+
+            self.logout(tokens["refreshToken"])
+
+            response = self.get_me(tokens["accessToken"])
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_new_login_after_logout_is_accepted(self):
+        old = self.login()
+        self.logout(old["refreshToken"])
+
+        new = self.login()
+        self.assertEqual(self.get_me(new["accessToken"]).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.get_me(old["accessToken"]).status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_refresh_token_rejected_after_logout(self):
+        tokens = self.login()
+        self.logout(tokens["refreshToken"])
+
+        response = self.client.post(
+            reverse("refresh_token"), {"refreshToken": tokens["refreshToken"]}, format="json"
+        )
+        self.assertNotEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TokenCompactionTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create_user(
+            "admin@restaurant.vn", "Admin", "secret!aa1", role=Role.ADMIN
+        )
+        now = timezone.now()
+        self.expired = [self.outstanding(f"expired-{index}", now - timedelta(days=1)) for index in range(5)]
+        self.live = self.outstanding("live", now + timedelta(days=1))
+        for token in (self.expired[0], self.expired[3], self.live):
+            BlacklistedToken.objects.create(token=token)
+
+    def outstanding(self, jti, expires_at):
+        return OutstandingToken.objects.create(
+            user=self.account, jti=jti, token=jti, expires_at=expires_at
+        )
+
+    def test_expired_tokens_are_removed_in_keyset_batches(self):
+        batches = list(compact_expired_tokens(batch_size=2))
+
+        # 5 expired tokens and 2 of their blacklist rows, 2 + 2 + 1 per batch
+        self.assertEqual([removed for removed, _seconds in batches], [3, 3, 1])
+        self.assertEqual(list(OutstandingToken.objects.all()), [self.live])
+        self.assertEqual(list(BlacklistedToken.objects.values_list("token", flat=True)), [self.live.pk])
+
+    def test_max_batches_stops_early(self):
+        list(compact_expired_tokens(batch_size=2, max_batches=1))
+        self.assertEqual(OutstandingToken.objects.count(), 4)
+
+    def test_pass_is_skipped_without_the_lock(self):
+        @contextmanager
+        def held_elsewhere():
+            yield False
+
+        with mock.patch("restaurantBE.accounts.services.tokens.compaction_lock", held_elsewhere):
+            self.assertIsNone(run_token_compaction())
+        self.assertEqual(OutstandingToken.objects.count(), 6)
+
+        self.assertEqual(run_token_compaction(), 7)
+
+class AccountCacheTests(TestCase):
+    """
+    Writes from another worker reach no signal in this process, they apply
+    once that worker bumps the account's shared version.
+    """
+
+    password = "secret!aa1"
+
+    def setUp(self):
+        self.account = Account.objects.create_user(
+            "admin@restaurant.vn", "Admin", self.password, role=Role.ADMIN
+        )
+        self.client = APIClient()
+        response = self.client.post(
+            reverse("login"),
+            {"email": self.account.email, "password": self.password},
+            format="json",
+        )
+        self.access = AccessToken(response.json()["data"]["accessToken"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        # Fill the cache
+        self.assertEqual(self.client.get(reverse("get_user")).status_code, status.HTTP_200_OK)
+
+    def update_elsewhere(self, **fields):
+        # What another worker does: write, then bump the shared version only
+        Account.objects.filter(pk=self.account.pk).update(**fields)
+        bump_version(accounts._version_key(self.account.pk))
+
+    def test_cached_account_reads_no_row(self):
+        with self.assertNumQueries(0):
+            user = accounts.get_cached_account(self.account.pk, self.access)
+        self.assertEqual(user.email, self.account.email)
+
+    def test_deactivation_applies_once_versioned(self):
+        self.update_elsewhere(is_active=False)
+
+        response = self.client.get(reverse("get_user"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_role_change_applies_once_versioned(self):
+        self.update_elsewhere(role=Role.EMPLOYEE)
+
+        response = self.client.get(reverse("get_employees"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_saved_profile_is_reloaded(self):
+        self.update_elsewhere(name="Renamed", update_at=timezone.now())
+
+        response = self.client.get(reverse("get_user"))
+        self.assertEqual(response.json()["data"]["name"], "Renamed")
+
+    def test_newer_token_generation_reloads_the_row(self):
+        Account.objects.filter(pk=self.account.pk).update(token_generation=5)
+        claims = {"iat": int(time.time()) + 60, "role": Role.ADMIN, "gen": 5}
+
+        with self.assertNumQueries(1):
+            user = accounts.get_cached_account(self.account.pk, claims)
+        self.assertEqual(user.token_generation, 5)
+
+
+class EmployeeListPaginationTests(TestCase):
+    def setUp(self):
+        admin = Account.objects.create_user(
+            "admin@restaurant.vn", "Admin", "secret!aa1", role=Role.ADMIN
+        )
+        for index in range(3):
+            Account.objects.create_user(f"employee{index}@restaurant.vn", f"E{index}", "secret!aa1")
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def test_page_parameter_is_rejected(self):
+        response = self.client.get(reverse("get_employees"), {"page": 2})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("page", response.json()["errors"])
+
+    def test_cursor_walks_every_employee_once(self):
+        seen, params = [], {"limit": 2}
+        while True:
+            data = self.client.get(reverse("get_employees"), params).json()["data"]
+            seen += [account["id"] for account in data["results"]]
+            if not data["next"]:
+                break
+            params = {"limit": 2, "cursor": parse_qs(urlsplit(data["next"]).query)["cursor"][0]}
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(len(set(seen)), 3)
+
+    def test_csv_export_renders_dates_like_json(self):
+        def export(kind):
+            response = self.client.get(reverse("export_employees"), {"type": kind})
+            return b"".join(response.streaming_content).decode()
+
+        rows = list(csv.DictReader(io.StringIO(export("csv"))))
+        employees = json.loads(export("json"))["data"]
+        self.assertEqual(
+            [(row["create_at"], row["update_at"]) for row in rows],
+            [(employee["create_at"], employee["update_at"]) for employee in employees],
+        )
+        self.assertTrue(rows[0]["create_at"].endswith("+07:00"))
+
+    def test_etag_comes_from_the_page_rows(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("get_employees"))
+        etag = response["ETag"]
+
+        response = self.client.get(reverse("get_employees"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        employee = Account.objects.filter(role=Role.EMPLOYEE).first()
+        employee.name = "Renamed"
+        employee.save()
+        response = self.client.get(reverse("get_employees"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class EmployeeImportTests(TestCase):
+    def setUp(self):
+        self.admin = Account.objects.create_user(
+            "admin@restaurant.vn", "Admin", "secret!aa1", role=Role.ADMIN
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def rows(self, count):
+        return [
+            {"email": f"employee{index}@restaurant.vn", "name": f"E{index}", "password": "secret!aa1"}
+            for index in range(count)
+        ]
+
+    def test_small_import_is_done_in_the_request(self):
+        response = self.client.post(reverse("import_employees"), self.rows(2), format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Account.objects.filter(role=Role.EMPLOYEE).count(), 2)
+
+    @override_settings(EMPLOYEE_IMPORT_SYNC_MAX_ROWS=2)
+    def test_large_import_runs_as_a_job(self):
+        with mock.patch(
+            "restaurantBE.accounts.views.accounts.submit_import", return_value=True
+        ) as submit:
+            response = self.client.post(reverse("import_employees"), self.rows(3), format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertFalse(Account.objects.filter(role=Role.EMPLOYEE).exists())
+
+        job, rows = submit.call_args.args
+        _, slots = employees._get_pool()
+        slots.acquire()
+        employees._run_import(job.pk, rows)
+
+        response = self.client.get(reverse("import_job", args=[job.pk]))
+        data = response.json()["data"]
+        self.assertEqual((data["status"], data["total"], data["count"]), (ImportStatus.DONE, 3, 3))
+        self.assertEqual(EmployeeImportJob.objects.get().owner, self.admin)
+
+    @override_settings(PASSWORD_HASH_WORKERS=2)
+    def test_passwords_are_hashed_in_one_spawned_pool(self):
+        passwords = [f"secret!{index}" for index in range(hashing.PARALLEL_HASH_MIN)]
+
+        hashes = hashing.hash_passwords(passwords)
+
+        self.assertTrue(all(map(check_password, passwords, hashes)))
+        pool = hashing._get_pool()
+        self.addCleanup(hashing._discard_pool, pool)
+        self.assertEqual(pool._mp_context.get_start_method(), "spawn")
+        self.assertIs(hashing._get_pool(), pool)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsgiConcurrencyTests(SimpleTestCase):
+    """
+    Under ASGI the middleware chain must not serialize the requests of
+    asgi_view views.
+    """
+
+    def test_requests_are_served_concurrently(self):
+        client = AsyncClient()
+
+        async def both():
+            return await asyncio.gather(client.get("/meet/"), client.get("/meet/"))
+
+        responses = async_to_sync(both)()
+        self.assertEqual([response.status_code for response in responses], [200, 200])
+
+    def test_streamed_body_does_not_block_the_event_loop(self):
+        _released.clear()
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/stream/",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+        }
+
+        async def stream():
+            communicator = ApplicationCommunicator(ASGIHandler(), scope)
+            await communicator.send_input({"type": "http.request"})
+            start = await communicator.receive_output(5)
+            body = (await communicator.receive_output(5))["body"]
+            _released.set()
+            while True:
+                message = await communicator.receive_output(5)
+                body += message.get("body", b"")
+                if not message.get("more_body"):
+                    return start["status"], body
+
+        self.assertEqual(async_to_sync(stream)(), (200, b"head,rest"))
@@ -8,16 +8,20 @@ from .views import (
     ChangePasswordAPIView,
     EmployeeDetailAPIView,
     EmployeeListCreateAPIView,
+    EmployeeImportAPIView,
+    EmployeeImportJobAPIView,
+    EmployeeExportAPIView,
     AccountAPIView
 )
+from restaurantBE.utils.async_views import asgi_view
 
 
 urlpatterns = [
     # Authentication
-    path("auth/register/", RegisterAPIView.as_view(), name="register"),
-    path("auth/login/", LoginAPIView.as_view(), name="login"),
-    path("auth/refresh-token/", RefreshTokenAPIView.as_view(), name="refresh_token"),
-    path("auth/logout/", LogoutAPIView.as_view(), name="logout"),
+    path("auth/register/", asgi_view(RegisterAPIView.as_view()), name="register"),
+    path("auth/login/", asgi_view(LoginAPIView.as_view()), name="login"),
+    path("auth/refresh-token/", asgi_view(RefreshTokenAPIView.as_view()), name="refresh_token"),
+    path("auth/logout/", asgi_view(LogoutAPIView.as_view()), name="logout"),
     # User Management
     path("me/", AccountAPIView.as_view(), name="get_user"),
     path("me/update/", AccountAPIView.as_view(), name="update_user"),
@@ -25,6 +29,13 @@ urlpatterns = [
 
     # Employee Management
     path("accounts/", EmployeeListCreateAPIView.as_view(), name="get_employees"),
+    path("accounts/import/", EmployeeImportAPIView.as_view(), name="import_employees"),
+    path(
+        "accounts/import/jobs/<uuid:job_id>/",
+        EmployeeImportJobAPIView.as_view(),
+        name="import_job",
+    ),
+    path("accounts/export/", EmployeeExportAPIView.as_view(), name="export_employees"),
     path("accounts/detail/<int:pk>/", EmployeeDetailAPIView.as_view(), name="employee"),
    
 
@@ -13,7 +13,10 @@ from .accounts import (
     AccountAPIView,
     ChangePasswordAPIView,
     EmployeeListCreateAPIView,
-    EmployeeDetailAPIView   
+    EmployeeDetailAPIView,
+    EmployeeImportAPIView,
+    EmployeeImportJobAPIView,
+    EmployeeExportAPIView,
 )
 
 __all__ = [
@@ -26,4 +29,7 @@ __all__ = [
     "ChangePasswordAPIView",
     "EmployeeListCreateAPIView",
     "EmployeeDetailAPIView",
+    "EmployeeImportAPIView",
+    "EmployeeImportJobAPIView",
+    "EmployeeExportAPIView",
 ]
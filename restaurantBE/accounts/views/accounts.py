@@ -1,19 +1,51 @@
 """
 User Management Views
-Handles: Get User Profile, Update Profile, Change Password
+Handles: Get User Profile, Update Profile, Change Password,
+Employee CRUD, Bulk Import and CSV Export
 """
 
+import csv
+import io
+import json
+
+from django.conf import settings
+from django.db import IntegrityError
 from django.http.response import Http404
 from rest_framework.generics import ListCreateAPIView
-from restaurantBE.utils.custom_pagination import CustomPagination
+from restaurantBE.utils.custom_pagination import KeysetPagination
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
-from restaurantBE.accounts.serializers import AccountSerializer
-from restaurantBE.utils.responses import apiError, apiSuccess
+from restaurantBE.accounts.serializers import (
+    ACCOUNT_FIELDS,
+    AccountSerializer,
+    EmployeeImportSerializer,
+    serialize_account,
+    serialize_accounts,
+)
+from restaurantBE.utils.async_views import StreamingResponse
+from restaurantBE.utils.conditional import make_etag, not_modified, with_validators
+from restaurantBE.utils.responses import apiError, apiStream, apiSuccess
 from rest_framework.generics import ListCreateAPIView
-from restaurantBE.accounts.models import Account
+from restaurantBE.accounts.models import Account, EmployeeImportJob
+from restaurantBE.accounts.services import import_employees, iter_employees_csv, submit_import
 from django.utils.translation import gettext_lazy as _
 
+
+def serialize_import_job(job):
+    return {
+        "jobId": str(job.id),
+        "status": job.status,
+        "total": job.total,
+        "count": job.count,
+        "error": job.error,
+    }
+
+
+def account_etag(account):
+    # update_at is serialized, so it changes with every serialized field
+    return make_etag("account", ACCOUNT_FIELDS, account.pk, account.update_at.isoformat())
+
+
 class AccountAPIView(generics.GenericAPIView):
     """
     Get & Update Current User Profile
@@ -29,11 +61,16 @@ class AccountAPIView(generics.GenericAPIView):
 
     def get(self, request):
         try:
-            serializer = self.get_serializer(self.get_object())
-            return apiSuccess(
-                serializer.data,
-                "get_user_success",
-                status=status.HTTP_200_OK,
+            user = self.get_object()
+            etag = account_etag(user)
+            response = not_modified(request, etag, user.update_at)
+            if response is not None:
+                return response
+
+            return with_validators(
+                apiSuccess(serialize_account(user), "get_user_success", status=status.HTTP_200_OK),
+                etag,
+                user.update_at,
             )
         except Exception as e:
             return apiError(
@@ -114,10 +151,12 @@ from restaurantBE.utils.permissions import IsAdmin
 class EmployeeListCreateAPIView(ListCreateAPIView):
     """
     Get All Employees + Create New Employee
-    GET /api/accounts?page=1&limit=10
+    GET /api/accounts?limit=10&cursor=<next cursor>&count=true
     POST /api/accounts
     """
-    pagination_class = CustomPagination
+    pagination_class = KeysetPagination
+    # Seek order of the pagination, served by account_role_create_at_idx
+    ordering = ("-create_at", "-id")
     permission_classes = [IsAuthenticated, IsAdmin]
     serializer_class = AccountSerializer
     
@@ -131,11 +170,39 @@ class EmployeeListCreateAPIView(ListCreateAPIView):
         return Account.objects.filter(role=Role.EMPLOYEE)
     
     def list(self, request, *args, **kwargs):
-        response = super().list(request, *args, **kwargs)
-        return apiSuccess(
-            data=response.data,
-            msg=_("get_employees_success"),
-            status=status.HTTP_200_OK,
+        # Serialize plain .values() rows, skipping model and DRF field overhead
+        queryset = self.filter_queryset(self.get_queryset()).values(*ACCOUNT_FIELDS)
+
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
+
+        # The validator comes from the rows already fetched: an update moves a
+        # row's update_at, an insert or delete changes the rows of the page
+        # (and the count when requested). No Last-Modified: a delete does not
+        # move it forward
+        etag = make_etag(
+            "employees",
+            ACCOUNT_FIELDS,
+            request.get_full_path(),
+            page is not None and self.paginator.count,
+            *[(row["id"], row["update_at"].isoformat()) for row in rows],
+        )
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        if page is not None:
+            data = self.get_paginated_response(serialize_accounts(page)).data
+        else:
+            data = serialize_accounts(rows)
+
+        return with_validators(
+            apiSuccess(
+                data=data,
+                msg=_("get_employees_success"),
+                status=status.HTTP_200_OK,
+            ),
+            etag,
         )
     def post(self, request, *args, **kwargs):
         response = super().post(request, *args, **kwargs)
@@ -146,6 +213,139 @@ class EmployeeListCreateAPIView(ListCreateAPIView):
         )
 
 
+class EmployeeImportAPIView(generics.GenericAPIView):
+    """
+    Create Employees in bulk
+    POST /api/accounts/import/
+    Body: JSON list (or {"accounts": [...]}) of {email, name, password, avatar},
+    or a multipart "file" in CSV (header row) or JSON
+    More than EMPLOYEE_IMPORT_SYNC_MAX_ROWS rows are imported in the
+    background: 202 with a job, poll GET /api/accounts/import/jobs/<jobId>/
+    """
+    permission_classes = [IsAuthenticated, IsAdmin]
+    serializer_class = EmployeeImportSerializer
+
+    def get_rows(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            data = request.data
+            return data.get("accounts") if isinstance(data, dict) else data
+
+        name = upload.name.lower()
+        try:
+            if name.endswith(".csv"):
+                reader = csv.DictReader(io.TextIOWrapper(upload, encoding="utf-8-sig"))
+                return list(reader)
+            if name.endswith(".json"):
+                return json.load(upload)
+        except (UnicodeDecodeError, ValueError, csv.Error):
+            pass
+        return None
+
+    def post(self, request, *args, **kwargs):
+        rows = self.get_rows(request)
+        if not isinstance(rows, list) or not rows:
+            return apiError(
+                None,
+                _("import_file_invalid"),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(rows) > settings.EMPLOYEE_IMPORT_MAX_ROWS:
+            return apiError(
+                {"max": settings.EMPLOYEE_IMPORT_MAX_ROWS},
+                _("import_too_many_rows"),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = self.get_serializer(data=rows, many=True)
+        if not serializer.is_valid():
+            return apiError(
+                serializer.errors,
+                _("validation_error"),
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        if len(rows) > settings.EMPLOYEE_IMPORT_SYNC_MAX_ROWS:
+            # Hashing this many passwords can outlast the request timeout
+            job = EmployeeImportJob.objects.create(owner=request.user, total=len(rows))
+            if not submit_import(job, serializer.validated_data):
+                job.delete()
+                return apiError(
+                    None,
+                    _("import_queue_full"),
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
+            return apiSuccess(
+                data=serialize_import_job(job),
+                msg=_("import_queued"),
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        try:
+            accounts = import_employees(serializer.validated_data)
+        except IntegrityError:
+            # An email was taken between the check and the insert
+            return apiError(
+                None,
+                _("email_exists"),
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        return apiSuccess(
+            data={"count": len(accounts), "accounts": serialize_accounts(accounts)},
+            msg=_("import_employees_success"),
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class EmployeeImportJobAPIView(generics.GenericAPIView):
+    """
+    Employee import job status
+    GET /api/accounts/import/jobs/<jobId>/
+    """
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request, job_id):
+        job = EmployeeImportJob.objects.filter(pk=job_id, owner=request.user).first()
+        if job is None:
+            return apiError(
+                None,
+                _("import_job_not_found"),
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return apiSuccess(
+            data=serialize_import_job(job),
+            msg=_("get_import_job_success"),
+            status=status.HTTP_200_OK,
+        )
+
+
+class EmployeeExportAPIView(generics.GenericAPIView):
+    """
+    Export all Employees as CSV (default) or in the JSON envelope, streamed
+    GET /api/accounts/export/?type=csv|json
+    """
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request, *args, **kwargs):
+        queryset = Account.objects.filter(role=Role.EMPLOYEE).order_by("id")
+        if request.query_params.get("type") == "json":
+            return apiStream(
+                queryset.values(*ACCOUNT_FIELDS),
+                serialize_accounts,
+                msg=_("get_employees_success"),
+                status=status.HTTP_200_OK,
+            )
+
+        response = StreamingResponse(
+            iter_employees_csv(queryset, ACCOUNT_FIELDS),
+            content_type="text/csv; charset=utf-8",
+        )
+        response["Content-Disposition"] = 'attachment; filename="employees.csv"'
+        return response
+
+
 class EmployeeDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     """
     Get, Update, Delete Employee by ID
@@ -167,11 +367,19 @@ class EmployeeDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = self.get_serializer(instance)
-        return apiSuccess(
-            data=serializer.data,
-            msg=_("get_employee_success"),
-            status=status.HTTP_200_OK,
+        etag = account_etag(instance)
+        response = not_modified(request, etag, instance.update_at)
+        if response is not None:
+            return response
+
+        return with_validators(
+            apiSuccess(
+                data=serialize_account(instance),
+                msg=_("get_employee_success"),
+                status=status.HTTP_200_OK,
+            ),
+            etag,
+            instance.update_at,
         )
 
     def update(self, request, *args, **kwargs):
@@ -10,19 +10,16 @@ from rest_framework.exceptions import ValidationError
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny
 from restaurantBE.accounts.serializers import (
-    AccountSerializer,
     LoginSerializer,
     RegisterSerializer,
+    serialize_account,
 )
 from django.utils.translation import gettext as _
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from restaurantBE.accounts.serializers.auth import RefreshTokenSerializer
 from restaurantBE.utils.responses import apiError, apiSuccess
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.token_blacklist.models import (
-    OutstandingToken,
-    BlacklistedToken,
-)
+from restaurantBE.accounts.services import revoke_user_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +39,7 @@ class RegisterAPIView(generics.GenericAPIView):
             serializer.is_valid(raise_exception=True)
             user = serializer.save()
             return apiSuccess(
-                AccountSerializer(user).data,
+                serialize_account(user),
                 "register_success",
                 status=status.HTTP_201_CREATED,
             )
@@ -70,53 +67,10 @@ class LoginAPIView(TokenObtainPairView):
     serializer_class = LoginSerializer
 
     def post(self, request, *args, **kwargs):
+        # Refresh token is recorded by RefreshToken.for_user, access tokens are
+        # not stored: they are revoked through Account.token_generation
         response = super().post(request, *args, **kwargs)
 
-        # Lưu CẢ access và refresh token vào OutstandingToken để blacklist mechanism hoạt động
-        if response.status_code == 200:
-            try:
-                from rest_framework_simplejwt.tokens import AccessToken
-                from django.utils import timezone
-
-                refresh_token_str = response.data.get("refresh")
-                access_token_str = response.data.get("access")
-
-                # Lưu refresh token
-                if refresh_token_str:
-                    refresh_token = RefreshToken(refresh_token_str)
-                    jti_refresh = refresh_token["jti"]
-
-                    if not OutstandingToken.objects.filter(jti=jti_refresh).exists():
-                        OutstandingToken.objects.create(
-                            user_id=refresh_token["user_id"],
-                            jti=jti_refresh,
-                            token=str(refresh_token),
-                            created_at=timezone.now(),
-                            expires_at=timezone.datetime.fromtimestamp(
-                                refresh_token["exp"], tz=timezone.utc
-                            ),
-                        )
-
-                # Lưu access token (QUAN TRỌNG để logout hoạt động)
-                if access_token_str:
-                    access_token = AccessToken(access_token_str)
-                    jti_access = access_token["jti"]
-
-                    if not OutstandingToken.objects.filter(jti=jti_access).exists():
-                        OutstandingToken.objects.create(
-                            user_id=access_token["user_id"],
-                            jti=jti_access,
-                            token=str(access_token),
-                            created_at=timezone.now(),
-                            expires_at=timezone.datetime.fromtimestamp(
-                                access_token["exp"], tz=timezone.utc
-                            ),
-                        )
-
-            except Exception:
-                # Silent failure or minimal log if needed
-                pass
-
         return apiSuccess(
             data=response.data, msg="login_success", status=response.status_code
         )
@@ -146,13 +100,9 @@ class LogoutAPIView(generics.GenericAPIView):
 
         try:
             token = RefreshToken(refreshToken)
-            user_id = token["user_id"]
-
-            # Blacklist ALL outstanding tokens of this user
-            tokens = OutstandingToken.objects.filter(user_id=user_id)
 
-            for t in tokens:
-                BlacklistedToken.objects.get_or_create(token=t)
+            # Blacklist ALL live outstanding tokens of this user in one statement
+            revoke_user_tokens(token["user_id"])
 
             return apiSuccess(
                 None,
@@ -10,11 +10,34 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
 import os
 from dotenv import load_dotenv
 
+from restaurantBE import startup
+
 # Load environment variables from .env file
 load_dotenv()
 
-from django.core.asgi import get_asgi_application
+import django
+from django.conf import settings
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurantBE.settings.production")
 
-application = get_asgi_application()
+with startup.phase("settings"):
+    settings.INSTALLED_APPS
+
+with startup.phase("django"):
+    # get_asgi_application(), with the handler that streams StreamingResponse
+    # bodies off the event loop
+    django.setup(set_prefix=False)
+    from restaurantBE.utils.async_views import ASGIHandler
+
+    django_application = ASGIHandler()
+
+from restaurantBE.tables.stream import with_table_stream
+
+# Table status Server-Sent Events are served next to Django, see tables/stream.py
+application = with_table_stream(django_application)
+
+startup.warm_up()
+startup.report()
+
+if not startup.preloaded():
+    startup.start_background_tasks()
@@ -7,4 +7,15 @@ class Role(models.TextChoices):
 class TableStatus(models.TextChoices):
     AVAILABLE  = "AVAILABLE", _("available")
     RESERVED  = "Reserved ", _("reserved")
-    HIDDEN = "HIDDEN", _("hidden")    
\ No newline at end of file
+    HIDDEN = "HIDDEN", _("hidden")    
+
+class UploadStatus(models.TextChoices):
+    PENDING = "PENDING", _("pending")
+    DONE = "DONE", _("completed")
+    FAILED = "FAILED", _("failed")
+
+class ImportStatus(models.TextChoices):
+    PENDING = "PENDING", _("pending")
+    RUNNING = "RUNNING", _("running")
+    DONE = "DONE", _("completed")
+    FAILED = "FAILED", _("failed")
@@ -0,0 +1,79 @@
+"""
+PostgreSQL (psycopg2) backend that borrows connections from a per-process
+pool instead of opening one per request.
+
+Settings, next to the usual keys of DATABASES["default"]:
+    "POOL": {"MAX_SIZE": 10, "TIMEOUT": 10, "CHECK_IDLE": 30}
+Keep CONN_MAX_AGE at 0 so connections go back to the pool after each request.
+"""
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+from django.db.backends.postgresql import base
+
+from restaurantBE.db.pool import ConnectionPool, PoolTimeout, get_pool
+
+
+def _is_usable(connection):
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        if not connection.autocommit:
+            connection.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_pool(self, conn_params):
+        options = self.settings_dict["OPTIONS"]
+        pool_settings = self.settings_dict.get("POOL", {})
+
+        def connect():
+            connection = psycopg2.connect(**conn_params)
+            if "isolation_level" in options:
+                connection.set_session(isolation_level=options["isolation_level"])
+            psycopg2.extras.register_default_jsonb(
+                conn_or_curs=connection, loads=lambda x: x
+            )
+            return connection
+
+        return get_pool(
+            self.alias,
+            lambda: ConnectionPool(
+                connect,
+                _is_usable,
+                max_size=pool_settings.get("MAX_SIZE", 10),
+                timeout=pool_settings.get("TIMEOUT", 10),
+                check_idle=pool_settings.get("CHECK_IDLE", 30),
+            ),
+        )
+
+    @base.async_unsafe
+    def get_new_connection(self, conn_params):
+        try:
+            connection = self.get_pool(conn_params).acquire()
+        except PoolTimeout as e:
+            raise psycopg2.OperationalError(str(e)) from e
+
+        self.isolation_level = connection.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        connection = self.connection
+        # Closed inside an atomic block, Django keeps a reference: never reuse
+        discard = self.in_atomic_block
+        if not discard and not connection.closed:
+            try:
+                status = connection.get_transaction_status()
+                if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+            except psycopg2.Error:
+                discard = True
+
+        self.get_pool(self.get_connection_params()).release(connection, discard=discard)
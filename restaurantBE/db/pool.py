@@ -0,0 +1,163 @@
+"""
+Per-process database connection pool
+Connections are handed out LIFO, checked before reuse when they sat idle
+for a while, and waits for a free slot are counted for the metrics.
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, connect, is_usable, max_size=10, timeout=10.0, check_idle=30.0):
+        """
+        connect() opens a new DB-API connection, is_usable(connection) runs
+        the health check. A connection idle for check_idle seconds or more is
+        health checked on checkout, a closed one is always dropped.
+        """
+        self.connect = connect
+        self.is_usable = is_usable
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_idle = check_idle
+        self.pid = os.getpid()
+
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._in_use = 0
+        self._stats = {
+            "checkouts": 0,
+            "connections_created": 0,
+            "connections_discarded": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "timeouts": 0,
+        }
+
+    def acquire(self):
+        if not self._slots.acquire(blocking=False):
+            self._wait_for_slot()
+
+        try:
+            connection = self._take_idle()
+            if connection is None:
+                connection = self.connect()
+                self._count("connections_created")
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+            self._stats["checkouts"] += 1
+        return connection
+
+    def release(self, connection, discard=False):
+        try:
+            if discard or connection.closed:
+                self._close(connection)
+                self._count("connections_discarded")
+            else:
+                with self._lock:
+                    self._idle.append((connection, time.monotonic()))
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+            }
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._close(connection)
+
+    def _wait_for_slot(self):
+        started = time.monotonic()
+        acquired = self._slots.acquire(timeout=self.timeout)
+        waited = time.monotonic() - started
+
+        with self._lock:
+            self._stats["waits"] += 1
+            self._stats["wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+            if not acquired:
+                self._stats["timeouts"] += 1
+
+        if not acquired:
+            raise PoolTimeout(
+                f"No database connection available after {self.timeout}s "
+                f"({self.max_size} in use)"
+            )
+        logger.debug("Waited %.3fs for a database connection", waited)
+
+    def _take_idle(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                connection, returned_at = self._idle.pop()
+
+            if connection.closed:
+                self._count("connections_discarded")
+                continue
+            if time.monotonic() - returned_at < self.check_idle or self.is_usable(connection):
+                return connection
+
+            self._count("health_check_failures")
+            self._close(connection)
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, factory):
+    """
+    Pool for a database alias in the current process, created by factory()
+    on first use and again after a fork.
+    """
+    pool = _pools.get(alias)
+    if pool is None or pool.pid != os.getpid():
+        with _pools_lock:
+            pool = _pools.get(alias)
+            if pool is None or pool.pid != os.getpid():
+                pool = _pools[alias] = factory()
+    return pool
+
+
+def pool_stats():
+    """
+    {alias: stats} for every pool of the current process.
+    """
+    return {alias: pool.stats() for alias, pool in _pools.items() if pool.pid == os.getpid()}
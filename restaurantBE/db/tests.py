@@ -0,0 +1,161 @@
+from unittest import mock
+
+import psycopg2
+import psycopg2.extensions
+from django.test import SimpleTestCase
+
+from restaurantBE.db.backends.postgresql_pool.base import DatabaseWrapper
+from restaurantBE.db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    isolation_level = psycopg2.extensions.ISOLATION_LEVEL_READ_COMMITTED
+
+    def __init__(self, status=psycopg2.extensions.TRANSACTION_STATUS_IDLE, rollback_error=False):
+        self.closed = 0
+        self.status = status
+        self.rollback_error = rollback_error
+        self.rolled_back = False
+
+    def close(self):
+        self.closed = 1
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        if self.rollback_error:
+            raise psycopg2.InterfaceError("connection already closed")
+        self.rolled_back = True
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+def make_pool(**kwargs):
+    is_usable = kwargs.pop("is_usable", lambda connection: True)
+    return ConnectionPool(FakeConnection, is_usable, **kwargs)
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_exhausted_pool_times_out(self):
+        pool = make_pool(max_size=1, timeout=0.01)
+        pool.acquire()
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+        stats = pool.stats()
+        self.assertEqual((stats["waits"], stats["timeouts"], stats["in_use"]), (1, 1, 1))
+
+    def test_released_slot_ends_the_wait(self):
+        pool = make_pool(max_size=1, timeout=0.01)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertIs(pool.acquire(), connection)
+        self.assertEqual(pool.stats()["waits"], 0)
+
+    def test_idle_connections_are_reused_lifo(self):
+        pool = make_pool()
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        self.assertIs(pool.acquire(), second)
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(pool.stats()["connections_created"], 2)
+
+    def test_stale_idle_connection_is_health_checked(self):
+        is_usable = mock.Mock(return_value=False)
+        pool = make_pool(check_idle=0, is_usable=is_usable)
+        stale = pool.acquire()
+        pool.release(stale)
+
+        connection = pool.acquire()
+        is_usable.assert_called_once_with(stale)
+        self.assertIsNot(connection, stale)
+        self.assertTrue(stale.closed)
+        self.assertEqual(pool.stats()["health_check_failures"], 1)
+
+    def test_recent_idle_connection_skips_the_health_check(self):
+        is_usable = mock.Mock(return_value=False)
+        pool = make_pool(check_idle=60, is_usable=is_usable)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertIs(pool.acquire(), connection)
+        is_usable.assert_not_called()
+
+    def test_closed_connection_is_not_reused(self):
+        pool = make_pool()
+        connection = pool.acquire()
+        connection.close()
+        pool.release(connection)
+
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertEqual(pool.stats()["connections_discarded"], 1)
+
+
+class PoolBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = make_pool()
+        self.wrapper = DatabaseWrapper(
+            {
+                "NAME": "restaurant",
+                "USER": "",
+                "PASSWORD": "",
+                "HOST": "",
+                "PORT": "",
+                "OPTIONS": {},
+                "POOL": {},
+                "TIME_ZONE": None,
+                "CONN_MAX_AGE": 0,
+                "AUTOCOMMIT": True,
+                "ATOMIC_REQUESTS": False,
+            },
+            "pooled",
+        )
+        self.wrapper.get_pool = lambda conn_params: self.pool
+
+    def close(self, connection, in_atomic_block=False):
+        # Check the connection out of the pool, then close it like Django does
+        self.pool.connect = lambda: connection
+        self.wrapper.connection = self.pool.acquire()
+        self.pool.connect = FakeConnection
+        self.wrapper.in_atomic_block = in_atomic_block
+        self.wrapper._close()
+
+    def test_idle_connection_goes_back_to_the_pool(self):
+        connection = FakeConnection()
+        self.close(connection)
+
+        self.assertIs(self.pool.acquire(), connection)
+
+    def test_open_transaction_is_rolled_back(self):
+        connection = FakeConnection(status=psycopg2.extensions.TRANSACTION_STATUS_INERROR)
+        self.close(connection)
+
+        self.assertTrue(connection.rolled_back)
+        self.assertIs(self.pool.acquire(), connection)
+
+    def test_connection_closed_in_atomic_block_is_discarded(self):
+        connection = FakeConnection(status=psycopg2.extensions.TRANSACTION_STATUS_INTRANS)
+        self.close(connection, in_atomic_block=True)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(self.pool.stats()["idle"], 0)
+
+    def test_connection_in_error_state_is_discarded(self):
+        connection = FakeConnection(
+            status=psycopg2.extensions.TRANSACTION_STATUS_INERROR, rollback_error=True
+        )
+        self.close(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(self.pool.stats()["connections_discarded"], 1)
+        self.assertIsNot(self.pool.acquire(), connection)
+
+    def test_exhausted_pool_raises_operational_error(self):
+        self.pool = make_pool(max_size=1, timeout=0.01)
+        self.pool.acquire()
+
+        with self.assertRaises(psycopg2.OperationalError):
+            self.wrapper.get_new_connection({})
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from restaurantBE.docs.schema import (
+    CODECS,
+    build_schema,
+    encode_schema,
+    schema_fingerprint,
+    write_artifact,
+)
+
+
+class Command(BaseCommand):
+    help = "Build the OpenAPI schema served at /docs/ into OPENAPI_SCHEMA_DIR"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None, help="Directory (default: OPENAPI_SCHEMA_DIR)")
+        parser.add_argument(
+            "--format", action="append", choices=sorted(CODECS), dest="formats",
+            help="Format to build, repeatable (default: all)",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        schema = build_schema()
+        fingerprint = schema_fingerprint()
+
+        failed = []
+        for name in options["formats"] or CODECS:
+            try:
+                artifact = encode_schema(schema, name)
+            except Exception as e:
+                failed.append(name)
+                self.stderr.write(f"openapi.{name}: {e}")
+                continue
+            write_artifact(name, artifact, fingerprint, options["output"])
+            self.stdout.write(
+                f"openapi.{name}: {len(artifact.content)} bytes ({len(artifact.gzipped)} gzipped)"
+            )
+
+        if failed:
+            raise CommandError(f"Could not encode: {', '.join(failed)}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Built OpenAPI schema in {time.monotonic() - started:.3f}s")
+        )
@@ -0,0 +1,154 @@
+"""
+Prebuilt OpenAPI schema
+drf_yasg walks every view and serializer to build the schema. It is built
+once instead: by `manage.py build_openapi` (run by build.sh and the
+Dockerfile) or on the first request, kept in memory with its gzip encoding
+and ETag, and written to OPENAPI_SCHEMA_DIR. A stored schema is reused until
+its fingerprint changes: the URLconf, HOST, the versions of the schema
+libraries or the mtime of any source file.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import django
+import drf_yasg
+import rest_framework
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+API_INFO = openapi.Info(
+    title="RestaurantBE API",
+    default_version="v1",
+    contact=openapi.Contact(email="dscdut@gmail.com"),
+)
+
+CODECS = {
+    "json": OpenAPICodecJson,
+    "yaml": OpenAPICodecYaml,
+}
+
+_lock = threading.Lock()
+_fingerprint = None
+_schema = None
+_artifacts = {}
+
+
+class SchemaArtifact:
+    def __init__(self, content, media_type):
+        self.content = content
+        self.gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+        self.media_type = media_type
+        self.etag = '"%s"' % hashlib.sha256(content).hexdigest()[:32]
+
+
+def _walk(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            callback = pattern.callback
+            view = getattr(callback, "cls", None) or getattr(callback, "view_class", None) or callback
+            yield f"{prefix}{pattern.pattern} {view.__module__}.{view.__qualname__}"
+
+
+def _sources():
+    # Serializers and docstrings shape the schema as much as the routes do
+    for path in sorted(Path(settings.BASE_DIR).rglob("*.py")):
+        stat = path.stat()
+        yield f"{path.relative_to(settings.BASE_DIR)} {stat.st_mtime_ns} {stat.st_size}"
+
+
+def schema_fingerprint():
+    """
+    Hash of every route and the view behind it, HOST, the library versions
+    and the source files.
+    """
+    parts = [
+        *_walk(get_resolver().url_patterns),
+        settings.HOST,
+        f"django {django.__version__}",
+        f"djangorestframework {rest_framework.VERSION}",
+        f"drf_yasg {drf_yasg.__version__}",
+        *_sources(),
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def build_schema():
+    """
+    The drf_yasg Swagger object, the slow part.
+    """
+    generator = OpenAPISchemaGenerator(API_INFO, url=settings.HOST + "api/")
+    return generator.get_schema(request=None, public=True)
+
+
+def encode_schema(schema, name):
+    codec = CODECS[name]
+    return SchemaArtifact(codec(validators=[]).encode(schema), codec.media_type)
+
+
+def _path(name, directory=None):
+    return os.path.join(directory or settings.OPENAPI_SCHEMA_DIR, f"openapi.{name}")
+
+
+def write_artifact(name, artifact, fingerprint, directory=None):
+    path = _path(name, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as output:
+        output.write(artifact.content)
+    # Next to the schema: the fingerprint it was built for
+    with open(f"{path}.fingerprint", "w") as output:
+        output.write(fingerprint)
+
+
+def read_artifact(name, fingerprint, directory=None):
+    """
+    Stored schema, None when missing or built for another fingerprint.
+    """
+    path = _path(name, directory)
+    try:
+        with open(f"{path}.fingerprint") as source:
+            if source.read().strip() != fingerprint:
+                return None
+        with open(path, "rb") as source:
+            return SchemaArtifact(source.read(), CODECS[name].media_type)
+    except OSError:
+        return None
+
+
+def _load_or_build(name):
+    global _fingerprint, _schema
+    if _fingerprint is None:
+        _fingerprint = schema_fingerprint()
+
+    artifact = read_artifact(name, _fingerprint)
+    if artifact is None:
+        if _schema is None:
+            _schema = build_schema()
+        artifact = encode_schema(_schema, name)
+        try:
+            write_artifact(name, artifact, _fingerprint)
+        except OSError:
+            # Read-only filesystem, keep it in memory only
+            pass
+    return artifact
+
+
+def get_schema_artifact(name):
+    """
+    Prebuilt schema in format name ("json" or "yaml"), built on first use.
+    """
+    artifact = _artifacts.get(name)
+    if artifact is None:
+        with _lock:
+            artifact = _artifacts.get(name)
+            if artifact is None:
+                artifact = _artifacts[name] = _load_or_build(name)
+    return artifact
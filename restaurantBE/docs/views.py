@@ -0,0 +1,50 @@
+"""
+Docs Views
+Handles: Prebuilt OpenAPI schema, Swagger UI
+"""
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+
+from restaurantBE.docs.schema import get_schema_artifact
+
+
+def _etag_matches(request, etag):
+    header = request.headers.get("If-None-Match", "")
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def openapi_schema_view(request, format="json"):
+    """
+    Get OpenAPI schema
+    GET /docs/openapi.json
+    GET /docs/openapi.yaml
+    """
+    artifact = get_schema_artifact(format)
+    if _etag_matches(request, artifact.etag):
+        response = HttpResponseNotModified()
+    elif "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = HttpResponse(artifact.gzipped, content_type=artifact.media_type)
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(artifact.content, content_type=artifact.media_type)
+
+    response["ETag"] = artifact.etag
+    # Always revalidate, the ETag makes that a 304 without a body
+    response["Cache-Control"] = "no-cache"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def docs_view(ui_view):
+    """
+    Swagger UI at /docs/, its ?format=openapi spec request gets the prebuilt
+    schema (the UI page itself does not walk the views).
+    """
+
+    def view(request, *args, **kwargs):
+        if request.GET.get("format") == "openapi":
+            return openapi_schema_view(request, "json")
+        return ui_view(request, *args, **kwargs)
+
+    return view
@@ -0,0 +1,52 @@
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+
+from restaurantBE.guests.models import Guest
+from restaurantBE.guests.tokens import get_table_generation
+from restaurantBE.tables.tokens import get_table_number_by_token
+
+
+class GuestSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Guest
+        fields = ("id", "name", "tableNumber", "create_at")
+        read_only_fields = ("id", "create_at")
+
+
+class GuestLoginSerializer(serializers.Serializer):
+    name = serializers.CharField(
+        max_length=100,
+        error_messages={
+            "blank": _("field_blank"),
+            "required": _("field_required"),
+        },
+    )
+    token = serializers.CharField(
+        max_length=255,
+        write_only=True,
+        error_messages={
+            "blank": _("field_blank"),
+            "required": _("field_required"),
+        },
+    )
+
+    def validate(self, attrs):
+        # The QR token alone identifies the table (unique index + cache)
+        number = get_table_number_by_token(attrs["token"])
+        generation = None if number is None else get_table_generation(number)
+        if generation is None:
+            raise serializers.ValidationError({"token": [_("table_token_invalid")]})
+
+        attrs["tableNumber"] = number
+        attrs["generation"] = generation
+        return attrs
+
+
+class GuestRefreshTokenSerializer(serializers.Serializer):
+    refreshToken = serializers.CharField(
+        write_only=True,
+        error_messages={
+            "blank": _("refresh_token_blank"),
+            "required": _("refresh_token_required"),
+        },
+    )
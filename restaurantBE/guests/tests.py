@@ -1,3 +1,26 @@
+from django.db.models import F
 from django.test import TestCase
+from rest_framework_simplejwt.exceptions import TokenError
 
-# Create your tests here.
+from restaurantBE.guests import tokens
+from restaurantBE.guests.tokens import get_table_generation, verify_guest_token
+from restaurantBE.tables.models import Table
+from restaurantBE.utils.cache import bump_version
+
+
+class GuestRevocationTests(TestCase):
+    def setUp(self):
+        Table.objects.create(number=1, capacity=4, token="token-1")
+
+    def test_revocation_in_another_process_rejects_old_tokens(self):
+        token = {"table": 1, "gen": get_table_generation(1)}
+        verify_guest_token(token)
+
+        # What revoke_table_guests leaves behind in another process: the new
+        # generation and a new shared version, this process' cache untouched
+        Table.objects.filter(pk=1).update(guest_generation=F("guest_generation") + 1)
+        bump_version(tokens._version_key(1))
+
+        with self.assertRaises(TokenError):
+            verify_guest_token(token)
+        self.assertEqual(get_table_generation(1), token["gen"] + 1)
@@ -0,0 +1,122 @@
+"""
+Guest Tokens
+Self-contained JWTs bound to a table. Verifying one needs no DB lookup:
+the only state is the table's guest_generation, read from an in-process
+cache, and bumping it revokes every token issued for that table. Cached
+generations carry the table's version from the shared cache, so a revocation
+in any process reaches every worker.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import Token
+
+from restaurantBE.tables.models import Table
+from restaurantBE.utils.cache import bump_version, get_version
+
+TABLE_CACHE_ALIAS = "tables"
+
+
+def _generation_key(number):
+    return f"table:{number}:generation"
+
+
+def _version_key(number):
+    return f"table:{number}:generation:version"
+
+
+def get_table_generation(number):
+    """
+    Current guest_generation of a table, None when the table does not exist.
+    """
+    cache = caches[TABLE_CACHE_ALIAS]
+    key = _generation_key(number)
+    version = get_version(_version_key(number))
+
+    entry = cache.get(key)
+    if entry is None or entry[0] != version:
+        generation = (
+            Table.objects.filter(pk=number)
+            .values_list("guest_generation", flat=True)
+            .first()
+        )
+        if generation is None:
+            return None
+        entry = (version, generation)
+        cache.set(key, entry)
+    return entry[1]
+
+
+def invalidate_table_generation(number):
+    caches[TABLE_CACHE_ALIAS].delete(_generation_key(number))
+    bump_version(_version_key(number))
+
+
+def revoke_table_guests(number):
+    """
+    Revoke every guest token of a table. Returns False when it does not exist.
+    """
+    updated = Table.objects.filter(pk=number).update(
+        guest_generation=F("guest_generation") + 1
+    )
+    invalidate_table_generation(number)
+    return bool(updated)
+
+
+class GuestAccessToken(Token):
+    token_type = "guest_access"
+    lifetime = settings.GUEST_ACCESS_TOKEN_LIFETIME
+
+
+class GuestRefreshToken(Token):
+    token_type = "guest_refresh"
+    lifetime = settings.GUEST_REFRESH_TOKEN_LIFETIME
+    claims = ("guest_id", "name", "table", "gen")
+
+    def set_guest(self, guest, generation):
+        self["guest_id"] = guest.id
+        self["name"] = guest.name
+        self["table"] = guest.tableNumber_id
+        self["gen"] = generation
+
+    @property
+    def access_token(self):
+        access = GuestAccessToken()
+        access.set_exp(from_time=self.current_time)
+        for claim in self.claims:
+            access[claim] = self[claim]
+        return access
+
+
+def verify_guest_token(token):
+    """
+    Raise TokenError when the table's generation moved past the token's.
+    """
+    if get_table_generation(token["table"]) != token["gen"]:
+        raise TokenError(_("guest_token_revoked"))
+
+
+class GuestUser:
+    """
+    Request user of a guest, built from the token claims only.
+    """
+
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+    is_staff = False
+    is_superuser = False
+    is_guest = True
+    role = None
+
+    def __init__(self, token):
+        self.token = token
+        self.id = self.pk = token["guest_id"]
+        self.name = token["name"]
+        self.table_number = token["table"]
+
+    def __str__(self):
+        return f"Guest {self.name} (table {self.table_number})"
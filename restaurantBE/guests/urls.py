@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import GuestAccountAPIView, GuestLoginAPIView, GuestRefreshTokenAPIView
+
+urlpatterns = [
+    path("guests/auth/login/", GuestLoginAPIView.as_view(), name="guest_login"),
+    path(
+        "guests/auth/refresh-token/",
+        GuestRefreshTokenAPIView.as_view(),
+        name="guest_refresh_token",
+    ),
+    path("guests/me/", GuestAccountAPIView.as_view(), name="get_guest"),
+]
@@ -1,9 +1,124 @@
-from django.shortcuts import render
-from rest_framework import generics
-from .models import Guest
-from .serializers import GuestSerializer
+"""
+Guest Views
+Handles: Guest Login by table QR token, Token Refresh, Current Guest
+"""
+
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework_simplejwt.exceptions import TokenError
+
+from restaurantBE.guests.models import Guest
+from restaurantBE.guests.serializers import (
+    GuestLoginSerializer,
+    GuestRefreshTokenSerializer,
+    GuestSerializer,
+)
+from restaurantBE.guests.tokens import GuestRefreshToken, verify_guest_token
+from restaurantBE.utils.authentication import GuestJWTAuthentication
+from restaurantBE.utils.permissions import IsGuest
+from restaurantBE.utils.responses import apiError, apiSuccess
+
 
-# Create your views here.
 class GuestListCreateView(generics.ListCreateAPIView):
     queryset = Guest.objects.all()
-    serializer_class = GuestSerializer
\ No newline at end of file
+    serializer_class = GuestSerializer
+
+
+class GuestLoginAPIView(generics.GenericAPIView):
+    """
+    Guest Login
+    POST /api/guests/auth/login/
+    Body: { "name": "...", "token": "<table QR token>" }
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    serializer_class = GuestLoginSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except ValidationError as e:
+            return apiError(
+                e.detail,
+                "validation_error",
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        data = serializer.validated_data
+        # jti and expiry exist before the insert, so login is a single write.
+        # They are only kept for reference, tokens are verified by signature
+        refresh = GuestRefreshToken()
+        guest = Guest.objects.create(
+            name=data["name"],
+            tableNumber_id=data["tableNumber"],
+            refeshToken=refresh["jti"],
+            refreshTokenExpiryAt=timezone.datetime.fromtimestamp(
+                refresh["exp"], tz=timezone.utc
+            ),
+        )
+        refresh.set_guest(guest, data["generation"])
+
+        return apiSuccess(
+            {
+                "accessToken": str(refresh.access_token),
+                "refreshToken": str(refresh),
+                "guest": GuestSerializer(guest).data,
+            },
+            "guest_login_success",
+            status=status.HTTP_200_OK,
+        )
+
+
+class GuestRefreshTokenAPIView(generics.GenericAPIView):
+    """
+    Guest Token Refresh
+    POST /api/guests/auth/refresh-token/
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    serializer_class = GuestRefreshTokenSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+            refresh = GuestRefreshToken(serializer.validated_data["refreshToken"])
+            verify_guest_token(refresh)
+        except ValidationError as e:
+            return apiError(
+                e.detail,
+                "validation_error",
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        except TokenError as e:
+            return apiError(
+                str(e),
+                "token_refresh_failed",
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        return apiSuccess(
+            {"accessToken": str(refresh.access_token)},
+            "token_refresh_success",
+            status=status.HTTP_200_OK,
+        )
+
+
+class GuestAccountAPIView(generics.GenericAPIView):
+    """
+    Current Guest, from the token claims only
+    GET /api/guests/me/
+    """
+    authentication_classes = [GuestJWTAuthentication]
+    permission_classes = [IsGuest]
+
+    def get(self, request):
+        guest = request.user
+        return apiSuccess(
+            {"id": guest.id, "name": guest.name, "tableNumber": guest.table_number},
+            "get_guest_success",
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,32 @@
+import time
+
+from restaurantBE.metrics.registry import observe
+from restaurantBE.utils.async_middleware import AsyncCapableMiddleware
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    Count every request and its latency under the URL name of its route
+    (paths are not used as labels, they would grow without bound).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def handle(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, started)
+        return response
+
+    @staticmethod
+    def record(request, response, started):
+        match = getattr(request, "resolver_match", None)
+        route = (match.url_name or match.view_name) if match else "unmatched"
+        observe(route, request.method, response.status_code, time.perf_counter() - started)
@@ -0,0 +1,129 @@
+"""
+Request metrics of the process
+Counters and latency histograms per URL name are kept in memory behind one
+short lock. With METRICS_DIR set, every process also writes a snapshot to
+METRICS_DIR/<pid>.json (at most every METRICS_FLUSH_INTERVAL seconds and at
+exit), and /metrics adds up the snapshots of all gunicorn workers.
+"""
+
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+from restaurantBE.db.pool import pool_stats
+
+# Upper bounds of the latency histogram, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_lock = threading.Lock()
+# (route, method, status) -> count
+_requests = defaultdict(int)
+# route -> count of 5xx responses
+_errors = defaultdict(int)
+# route -> [count per bucket (+Inf last), sum of durations]
+_durations = {}
+_last_flush = 0.0
+
+
+def observe(route, method, status, duration):
+    """
+    Record one request.
+    """
+    bucket = len(BUCKETS)
+    for index, bound in enumerate(BUCKETS):
+        if duration <= bound:
+            bucket = index
+            break
+
+    with _lock:
+        _requests[(route, method, status)] += 1
+        if status >= 500:
+            _errors[route] += 1
+        histogram = _durations.get(route)
+        if histogram is None:
+            histogram = _durations[route] = [[0] * (len(BUCKETS) + 1), 0.0]
+        histogram[0][bucket] += 1
+        histogram[1] += duration
+
+    if settings.METRICS_DIR and time.monotonic() - _last_flush >= settings.METRICS_FLUSH_INTERVAL:
+        flush()
+
+
+def snapshot():
+    """
+    JSON-ready copy of this process' metrics.
+    """
+    with _lock:
+        return {
+            "pid": os.getpid(),
+            "requests": [[*key, count] for key, count in _requests.items()],
+            "errors": [[route, count] for route, count in _errors.items()],
+            "durations": [
+                [route, list(counts), total] for route, (counts, total) in _durations.items()
+            ],
+            "pools": pool_stats(),
+        }
+
+
+def flush():
+    """
+    Write this process' snapshot to METRICS_DIR, replacing the previous one.
+    """
+    global _last_flush
+    _last_flush = time.monotonic()
+
+    os.makedirs(settings.METRICS_DIR, exist_ok=True)
+    path = os.path.join(settings.METRICS_DIR, f"{os.getpid()}.json")
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as output:
+        json.dump(snapshot(), output)
+    os.replace(temporary, path)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def collect():
+    """
+    Snapshots of every process: this one live, the others from METRICS_DIR.
+    Counters of exited workers are kept so totals never go down, pool
+    gauges only come from running processes.
+    """
+    snapshots = [snapshot()]
+    if not settings.METRICS_DIR:
+        return snapshots
+
+    own = f"{os.getpid()}.json"
+    for path in glob.glob(os.path.join(settings.METRICS_DIR, "*.json")):
+        if os.path.basename(path) == own:
+            continue
+        try:
+            with open(path) as source:
+                data = json.load(source)
+        except (OSError, ValueError):
+            continue
+        if not _alive(data["pid"]):
+            data["pools"] = {}
+        snapshots.append(data)
+    return snapshots
+
+
+def _flush_at_exit():
+    if settings.METRICS_DIR and _requests:
+        flush()
+
+
+atexit.register(_flush_at_exit)
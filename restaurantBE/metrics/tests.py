@@ -0,0 +1,46 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from restaurantBE.metrics.views import render_metrics
+
+
+class MetricsAccessTests(TestCase):
+    @override_settings(METRICS_TOKEN="", METRICS_PUBLIC=False)
+    def test_closed_without_token_by_default(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(METRICS_TOKEN="", METRICS_PUBLIC=True)
+    def test_open_when_public(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_TOKEN="scrape", METRICS_PUBLIC=True)
+    def test_token_is_required_when_set(self):
+        self.assertEqual(
+            self.client.get(reverse("metrics")).status_code, status.HTTP_403_FORBIDDEN
+        )
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class PoolMetricsTests(TestCase):
+    def test_pool_waits_are_exported(self):
+        stats = {
+            "in_use": 2, "idle": 1, "max_size": 3,
+            "waits": 4, "wait_seconds": 1.5, "max_wait_seconds": 0.75, "timeouts": 1,
+        }
+        snapshot = {"pid": 7, "requests": [], "errors": [], "durations": [], "pools": {"default": stats}}
+        with mock.patch("restaurantBE.metrics.views.collect", return_value=[snapshot]):
+            lines = render_metrics().splitlines()
+
+        labels = '{pid="7",alias="default"}'
+        self.assertIn(f"db_pool_waits_total{labels} 4", lines)
+        self.assertIn(f"db_pool_wait_seconds_total{labels} 1.5", lines)
+        self.assertIn(f"db_pool_timeouts_total{labels} 1", lines)
+        self.assertIn(f"db_pool_max_wait_seconds{labels} 0.75", lines)
+        self.assertIn("# TYPE db_pool_waits_total counter", lines)
+        self.assertIn("# TYPE db_pool_max_wait_seconds gauge", lines)
@@ -0,0 +1,126 @@
+"""
+Metrics View
+GET /metrics in the Prometheus text format
+Needs Authorization: Bearer <METRICS_TOKEN>, without a token configured it
+is only served with METRICS_PUBLIC=true.
+"""
+
+import hmac
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse, HttpResponseForbidden
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from restaurantBE.metrics.registry import BUCKETS, collect
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _labels(**labels):
+    return ",".join(
+        '%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+
+
+def _table_rows(model):
+    table = model._meta.db_table
+    if connection.vendor == "postgresql":
+        # Planner estimate, count(*) would scan the whole table on every scrape
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+            row = cursor.fetchone()
+        if row is not None and row[0] >= 0:
+            return row[0]
+    return model.objects.count()
+
+
+def render_metrics():
+    requests, errors, durations = {}, {}, {}
+    pools = []
+    for snapshot in collect():
+        for route, method, status, count in snapshot["requests"]:
+            key = (route, method, status)
+            requests[key] = requests.get(key, 0) + count
+        for route, count in snapshot["errors"]:
+            errors[route] = errors.get(route, 0) + count
+        for route, counts, total in snapshot["durations"]:
+            merged = durations.setdefault(route, [[0] * len(counts), 0.0])
+            merged[0] = [a + b for a, b in zip(merged[0], counts)]
+            merged[1] += total
+        for alias, stats in snapshot["pools"].items():
+            pools.append((snapshot["pid"], alias, stats))
+
+    lines = [
+        "# HELP http_requests_total Requests per URL name, method and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (route, method, status), count in sorted(requests.items()):
+        lines.append(
+            f"http_requests_total{{{_labels(route=route, method=method, status=status)}}} {count}"
+        )
+
+    lines += [
+        "# HELP http_request_errors_total 5xx responses per URL name.",
+        "# TYPE http_request_errors_total counter",
+    ]
+    for route, count in sorted(errors.items()):
+        lines.append(f"http_request_errors_total{{{_labels(route=route)}}} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds Request latency per URL name.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for route, (counts, total) in sorted(durations.items()):
+        cumulative = 0
+        for bound, count in zip((*BUCKETS, "+Inf"), counts):
+            cumulative += count
+            lines.append(
+                f"http_request_duration_seconds_bucket{{{_labels(route=route, le=bound)}}} {cumulative}"
+            )
+        lines.append(f"http_request_duration_seconds_sum{{{_labels(route=route)}}} {total}")
+        lines.append(f"http_request_duration_seconds_count{{{_labels(route=route)}}} {cumulative}")
+
+    lines += [
+        "# HELP db_pool_connections Pooled DB connections per worker.",
+        "# TYPE db_pool_connections gauge",
+    ]
+    for pid, alias, stats in pools:
+        for state in ("in_use", "idle", "max_size"):
+            lines.append(
+                f"db_pool_connections{{{_labels(pid=pid, alias=alias, state=state)}}} {stats[state]}"
+            )
+
+    # Only checkouts that found the pool full wait
+    for name, kind, help_text, stat in (
+        ("db_pool_waits_total", "counter", "Checkouts that waited for a connection.", "waits"),
+        ("db_pool_wait_seconds_total", "counter", "Seconds spent waiting for a connection.", "wait_seconds"),
+        ("db_pool_timeouts_total", "counter", "Checkouts that timed out waiting.", "timeouts"),
+        ("db_pool_max_wait_seconds", "gauge", "Longest wait for a connection.", "max_wait_seconds"),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for pid, alias, stats in pools:
+            lines.append(f"{name}{{{_labels(pid=pid, alias=alias)}}} {stats[stat]}")
+
+    lines += [
+        "# HELP jwt_token_table_rows Rows of the token blacklist tables.",
+        "# TYPE jwt_token_table_rows gauge",
+        f'jwt_token_table_rows{{table="outstanding"}} {_table_rows(OutstandingToken)}',
+        f'jwt_token_table_rows{{table="blacklisted"}} {_table_rows(BlacklistedToken)}',
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not hmac.compare_digest(request.headers.get("Authorization", ""), expected):
+            return HttpResponseForbidden()
+    elif not settings.METRICS_PUBLIC:
+        # No token configured: closed unless opened on purpose
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
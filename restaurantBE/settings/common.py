@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -34,16 +35,19 @@ INSTALLED_APPS = [
     "restaurantBE.accounts",
     "restaurantBE.upload",
     "restaurantBE.tables",
-    "restaurantBE.guests"   
+    "restaurantBE.guests",
+    "restaurantBE.docs",
 ]
 
 MIDDLEWARE = [
+    "restaurantBE.metrics.middleware.MetricsMiddleware",
+    "restaurantBE.utils.profiling.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "restaurantBE.utils.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.locale.LocaleMiddleware",  # Middleware đa ngôn ngữ
+    "restaurantBE.utils.middleware.LocaleMiddleware",  # Middleware đa ngôn ngữ
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -70,6 +74,14 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "restaurantBE.wsgi.application"
 
+ASGI_APPLICATION = "restaurantBE.asgi.application"
+
+# wsgi | asgi, see gunicorn.conf.py. Under asgi the auth and upload views
+# run as coroutine views on a pool of ASGI_THREADS threads
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+ASYNC_VIEWS = SERVER_MODE == "asgi"
+ASGI_THREADS = int(os.getenv("ASGI_THREADS", "16"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -122,15 +134,84 @@ STATICFILES_DIRS = (
     os.path.join(BASE_DIR, "static"),
 )
 
+MEDIA_ROOT = os.getenv("MEDIA_ROOT", os.path.join(BASE_DIR, "media"))
+
+MEDIA_URL = "/media/"
+
+# Upload
+UPLOAD_STORAGE_BACKEND = os.getenv(
+    "UPLOAD_STORAGE_BACKEND", "restaurantBE.upload.storage.CloudinaryStorage"
+)
+# Background uploads per process: running transfers and queued + running cap
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "4"))
+UPLOAD_MAX_PENDING = int(os.getenv("UPLOAD_MAX_PENDING", "32"))
+# Stored image variants: name -> longest edge in px, encoded as WEBP or JPEG
+UPLOAD_IMAGE_VARIANTS = {"thumbnail": 320, "medium": 1024, "original": 2560}
+UPLOAD_IMAGE_FORMAT = os.getenv("UPLOAD_IMAGE_FORMAT", "WEBP")
+UPLOAD_IMAGE_QUALITY = int(os.getenv("UPLOAD_IMAGE_QUALITY", "80"))
+# Larger images are rejected from their header, before any pixel is decoded
+UPLOAD_IMAGE_MAX_PIXELS = int(os.getenv("UPLOAD_IMAGE_MAX_PIXELS", "25000000"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache
+# Per-process caches: an entry is rebuilt when its version key in the shared
+# cache moves, and after TIMEOUT seconds at the latest
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "accounts": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "accounts",
+        "TIMEOUT": int(os.getenv("ACCOUNT_CACHE_TIMEOUT", "60")),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("ACCOUNT_CACHE_MAX_ENTRIES", "1000")),
+        },
+    },
+    "tables": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tables",
+        "TIMEOUT": int(os.getenv("TABLE_CACHE_TIMEOUT", "30")),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("TABLE_CACHE_MAX_ENTRIES", "1000")),
+        },
+    },
+    # Version keys of the caches above (restaurantBE.utils.cache), read by
+    # every worker. The file cache is shared by the workers of one host, point
+    # it at memcached when the app runs on several hosts.
+    "shared": {
+        "BACKEND": os.getenv(
+            "SHARED_CACHE_BACKEND",
+            "django.core.cache.backends.filebased.FileBasedCache",
+        ),
+        "LOCATION": os.getenv(
+            "SHARED_CACHE_LOCATION",
+            os.path.join(tempfile.gettempdir(), "restaurantBE-shared-cache"),
+        ),
+        "TIMEOUT": None,
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "10000")),
+        },
+    },
+}
+
 # Rest framework option
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "restaurantBE.utils.authentication.CachedJWTAuthentication",
+    ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "restaurantBE.utils.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "restaurantBE.utils.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 10,
@@ -161,7 +242,53 @@ SIMPLE_JWT = {
     "TOKEN_TYPE_CLAIM": "token_type",
 }
 
+# Table status stream (ASGI only): seconds between keepalive comments and
+# between checks for changes made by other processes
+TABLE_STREAM_KEEPALIVE = int(os.getenv("TABLE_STREAM_KEEPALIVE", "15"))
+TABLE_STREAM_POLL_INTERVAL = float(os.getenv("TABLE_STREAM_POLL_INTERVAL", "2"))
+# Every poll scans this many seconds back again, for rows that committed late
+# or were stamped by a clock running behind
+TABLE_STREAM_POLL_OVERLAP = float(os.getenv("TABLE_STREAM_POLL_OVERLAP", "30"))
+
+# Expired token compaction in the server processes, disabled when 0 (seconds).
+# A PostgreSQL advisory lock lets one process run each pass
+TOKEN_COMPACTION_INTERVAL = int(os.getenv("TOKEN_COMPACTION_INTERVAL", "0"))
+TOKEN_COMPACTION_BATCH_SIZE = int(os.getenv("TOKEN_COMPACTION_BATCH_SIZE", "1000"))
+
+# Guest tokens, signed with SIMPLE_JWT["SIGNING_KEY"] and bound to a table
+GUEST_ACCESS_TOKEN_LIFETIME = timedelta(hours=4)
+GUEST_REFRESH_TOKEN_LIFETIME = timedelta(days=1)
+
+# Employee bulk import: max rows per request, rows per INSERT and password
+# hashing processes (0 = one per CPU). Imports of more than
+# EMPLOYEE_IMPORT_SYNC_MAX_ROWS rows run as a background job (202), at most
+# EMPLOYEE_IMPORT_MAX_PENDING of them waiting or running per process
+EMPLOYEE_IMPORT_MAX_ROWS = int(os.getenv("EMPLOYEE_IMPORT_MAX_ROWS", "1000"))
+EMPLOYEE_IMPORT_BATCH_SIZE = int(os.getenv("EMPLOYEE_IMPORT_BATCH_SIZE", "500"))
+EMPLOYEE_IMPORT_SYNC_MAX_ROWS = int(os.getenv("EMPLOYEE_IMPORT_SYNC_MAX_ROWS", "50"))
+EMPLOYEE_IMPORT_MAX_PENDING = int(os.getenv("EMPLOYEE_IMPORT_MAX_PENDING", "4"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+
+# Request profiling (utils/profiling.py): share of requests measured, and
+# cProfile dumps to PROFILING_DIR for sampled requests slower than
+# PROFILING_SLOW_MS (0 = no cProfile)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "1"))
+PROFILING_SLOW_MS = int(os.getenv("PROFILING_SLOW_MS", "0"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", os.path.join(BASE_DIR, "profiles"))
+
+# Metrics (GET /metrics): snapshots of every worker are shared through
+# METRICS_DIR (empty = this process only). Scrapes need METRICS_TOKEN as a
+# Bearer token; without one /metrics is closed unless METRICS_PUBLIC=true
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "false").lower() == "true"
+
 # Docs
+# Prebuilt OpenAPI schema, see `manage.py build_openapi`
+OPENAPI_SCHEMA_DIR = os.getenv("OPENAPI_SCHEMA_DIR", os.path.join(BASE_DIR, "openapi"))
+
 SWAGGER_SETTINGS = {
     "SECURITY_DEFINITIONS": {
         "Bearer": {"type": "apiKey", "name": "Authorization", "in": "header"}
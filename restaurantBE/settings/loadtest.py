@@ -0,0 +1,23 @@
+"""
+Settings for the load test harness (benchmarks/load_test.py): production
+settings against a local database, LOADTEST_DATABASE=sqlite swaps
+PostgreSQL for a SQLite file so a run needs no database server
+"""
+
+from .production import *
+
+DEBUG = False
+
+ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
+
+if os.getenv("LOADTEST_DATABASE", "postgresql") == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv(
+                "LOADTEST_SQLITE_PATH", os.path.join(BASE_DIR.parent, "loadtest.sqlite3")
+            ),
+            # Concurrent logins wait for the write lock instead of failing
+            "OPTIONS": {"timeout": 30},
+        }
+    }
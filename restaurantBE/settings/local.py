@@ -15,6 +15,9 @@ ALLOWED_HOSTS = ["*"]
 
 HOST = "http://localhost:8000/"
 
+# /metrics without a token during development
+METRICS_PUBLIC = True
+
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
@@ -18,14 +18,28 @@ HOST = os.getenv("HOST", "http://localhost:8000/")
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
+# DB_POOL=true borrows connections from a per-worker pool (restaurantBE/db),
+# otherwise connections are kept open for DB_CONN_MAX_AGE seconds
+DB_POOL = os.getenv("DB_POOL", "false").lower() == "true"
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql_psycopg2",
+        "ENGINE": (
+            "restaurantBE.db.backends.postgresql_pool"
+            if DB_POOL
+            else "django.db.backends.postgresql_psycopg2"
+        ),
         "NAME": os.getenv("DB_NAME", "restaurant"),
         "USER": os.getenv("DB_USERNAME", "postgres"),
         "PASSWORD": os.getenv("DB_PASSWORD", "postgres"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "POOL": {
+            "MAX_SIZE": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "TIMEOUT": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            "CHECK_IDLE": float(os.getenv("DB_POOL_CHECK_IDLE", "30")),
+        },
     }
 }
 
@@ -33,3 +47,20 @@ DATABASES = {
 CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000").split(
     ","
 )
+
+# Application logs (startup phases, profiling, background tasks) on stderr
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "restaurantBE": {
+            "handlers": ["console"],
+            "level": os.getenv("LOG_LEVEL", "INFO"),
+        },
+    },
+}
@@ -0,0 +1,85 @@
+"""
+Process start up shared by wsgi.py and asgi.py: timed load phases, warm up
+of the lazily imported parts and the background tasks of a serving process.
+
+With GUNICORN_PRELOAD=true the application is loaded once in the gunicorn
+master and forked into the workers, background threads do not survive a
+fork so gunicorn.conf.py starts them in post_fork instead.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+phases = []
+
+_background_pid = None
+
+
+@contextmanager
+def phase(name):
+    """
+    Time a load phase, see report().
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases.append((name, (time.perf_counter() - started) * 1000))
+
+
+def report():
+    """
+    Log the load phases of this process in one line.
+    """
+    total = sum(duration for _, duration in phases)
+    logger.info(
+        "Application loaded in %.0fms (%s)",
+        total,
+        ", ".join(f"{name} {duration:.0f}ms" for name, duration in phases),
+    )
+
+
+def warm_up():
+    """
+    Import what Django otherwise imports on the first request (URLconf, views,
+    serializers) and fill the message cache, so a preloaded master shares
+    them with its workers.
+    """
+    from django.urls import get_resolver
+
+    from restaurantBE.utils.messages import preload_messages
+
+    with phase("urls"):
+        get_resolver().url_patterns
+    with phase("messages"):
+        preload_messages()
+
+
+def preloaded():
+    """
+    True when gunicorn loads the application in the master, see gunicorn.conf.py.
+    """
+    return os.getenv("GUNICORN_PRELOAD", "false").lower() == "true"
+
+
+def start_background_tasks():
+    """
+    Start the background threads of a serving process, once per process.
+    """
+    global _background_pid
+    if _background_pid == os.getpid():
+        return
+    _background_pid = os.getpid()
+
+    from django.conf import settings
+
+    from restaurantBE.accounts.services import start_token_compaction
+
+    if settings.TOKEN_COMPACTION_INTERVAL:
+        start_token_compaction(
+            settings.TOKEN_COMPACTION_INTERVAL, settings.TOKEN_COMPACTION_BATCH_SIZE
+        )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TablesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'restaurantBE.tables'
+
+    def ready(self):
+        from restaurantBE.tables import signals  # noqa: F401
@@ -0,0 +1,138 @@
+"""
+In-memory fan-out of table status changes to stream listeners
+Each change is encoded once and handed to every listener's queue. Changes
+made by other processes are picked up by one poller per process (updated
+tables and TableDeletion tombstones), so the cost does not grow with the
+number of listeners. Each poll scans TABLE_STREAM_POLL_OVERLAP seconds back
+again and skips the (row, timestamp) pairs it already handled.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event, data):
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n".encode()
+
+
+class TableEventHub:
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._poller = None
+        # (kind, id, timestamp) of the changes seen inside the overlap window
+        self._seen = {}
+
+    def subscribe(self):
+        """
+        Register a listener on the running event loop, returns its queue.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.add((loop, queue))
+        if self._poller is None or self._poller.done():
+            self._poller = loop.create_task(self._poll())
+        return queue
+
+    def unsubscribe(self, queue):
+        with self._lock:
+            self._subscribers = {sub for sub in self._subscribers if sub[1] is not queue}
+
+    def publish_table(self, data):
+        """
+        Push a table payload unless this version was already sent.
+        Safe to call from any thread.
+        """
+        version = str(data.get("update_at"))
+        with self._lock:
+            if self._versions.get(data["number"]) == version:
+                return
+            self._versions[data["number"]] = version
+        self.publish(format_event("table", data))
+
+    def publish_deleted(self, number, delete_at):
+        """
+        Push a table deletion unless it was already sent, delete_at is the
+        time of its tombstone.
+        """
+        version = f"deleted {delete_at}"
+        with self._lock:
+            if self._versions.get(number) == version:
+                return
+            self._versions[number] = version
+        self.publish(format_event("table_deleted", {"number": number}))
+
+    def publish(self, message):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(self._deliver, queue, message)
+
+    @staticmethod
+    def _deliver(queue, message):
+        # Slow listeners lose their oldest pending message, never block others
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+    async def _poll(self):
+        since = timezone.now()
+        while self._subscribers:
+            await asyncio.sleep(settings.TABLE_STREAM_POLL_INTERVAL)
+            try:
+                since = await sync_to_async(self._publish_changes, thread_sensitive=False)(
+                    since
+                )
+            except Exception:
+                logger.exception("Table status poll failed")
+
+    def _publish_changes(self, since):
+        from restaurantBE.tables.models import Table, TableDeletion
+        from restaurantBE.tables.serializers import table_event
+
+        start = since - timedelta(seconds=settings.TABLE_STREAM_POLL_OVERLAP)
+        try:
+            changes = [
+                (table.update_at, table) for table in Table.objects.filter(update_at__gt=start)
+            ]
+            changes += [
+                (tombstone.delete_at, tombstone)
+                for tombstone in TableDeletion.objects.filter(delete_at__gt=start)
+            ]
+            # Oldest first, a table deleted then created again ends up present
+            changes.sort(key=lambda change: change[0])
+            for changed_at, change in changes:
+                deleted = isinstance(change, TableDeletion)
+                key = ("deleted" if deleted else "table", change.pk, changed_at)
+                if key in self._seen:
+                    continue
+                self._seen[key] = changed_at
+
+                if deleted:
+                    self.publish_deleted(change.number, changed_at)
+                else:
+                    self.publish_table(table_event(change))
+                since = max(since, changed_at)
+        finally:
+            close_old_connections()
+
+        # Older changes are not scanned again
+        start = since - timedelta(seconds=settings.TABLE_STREAM_POLL_OVERLAP)
+        self._seen = {key: at for key, at in self._seen.items() if at > start}
+        return since
+
+hub = TableEventHub()
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from restaurantBE.tables.tokens import rotate_table_tokens
+
+
+class Command(BaseCommand):
+    help = "Regenerate table QR tokens in one bulk update"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table",
+            type=int,
+            action="append",
+            dest="tables",
+            help="Table number to rotate, repeatable (default: every table)",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        rotated = rotate_table_tokens(options["tables"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rotated {rotated} table tokens in {time.monotonic() - started:.3f}s"
+            )
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.14 on 2026-10-18 13:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tables', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='table',
+            name='guest_generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 3.2.14 on 2026-10-18 14:01
+
+import secrets
+
+from django.db import migrations, models
+
+
+def regenerate_duplicate_tokens(apps, schema_editor):
+    """
+    Tables created before tokens were generated may share a token (or have
+    an empty one), give those a fresh token so the unique index can build.
+    """
+    Table = apps.get_model("tables", "Table")
+    seen = set()
+    for table in Table.objects.order_by("number").only("number", "token"):
+        if table.token and table.token not in seen:
+            seen.add(table.token)
+            continue
+        table.token = secrets.token_urlsafe(32)
+        table.save(update_fields=["token"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tables', '0002_table_guest_generation'),
+    ]
+
+    operations = [
+        migrations.RunPython(regenerate_duplicate_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='table',
+            name='token',
+            field=models.CharField(max_length=255, unique=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.14 on 2026-10-18 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tables', '0003_table_token_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.IntegerField()),
+                ('delete_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'db_table': 'TableDeletion',
+            },
+        ),
+    ]
@@ -5,7 +5,9 @@ class Table(models.Model):
     number = models.IntegerField(primary_key=True)
     capacity = models.IntegerField(null=False)
     status = models.CharField(max_length=20, choices=TableStatus.choices, default=TableStatus.AVAILABLE)
-    token = models.CharField(max_length=255, null=False)
+    token = models.CharField(max_length=255, null=False, unique=True)
+    # Bumped to revoke every guest token issued for this table
+    guest_generation = models.PositiveIntegerField(default=0)
     create_at = models.DateTimeField(auto_now_add=True)
     update_at = models.DateTimeField(auto_now=True)
 
@@ -13,4 +15,16 @@ class Table(models.Model):
         db_table = "Table"
 
     def __str__(self):
-        return f"Table {self.number}"
\ No newline at end of file
+        return f"Table {self.number}"
+
+class TableDeletion(models.Model):
+    """
+    Tombstone of a deleted table, read by the status stream pollers of the
+    other processes (a deleted row leaves nothing behind to poll).
+    """
+
+    number = models.IntegerField()
+    delete_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "TableDeletion"
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from restaurantBE.tables.models import Table
+
+
+class TableSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Table
+        fields = ("number", "capacity", "status", "token", "create_at", "update_at")
+        read_only_fields = ("token", "create_at", "update_at")
+
+
+def table_event(instance):
+    """
+    Payload pushed to the status stream for a table (no QR token).
+    """
+    data = TableSerializer(instance).data
+    data.pop("token")
+    return dict(data)
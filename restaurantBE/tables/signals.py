@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from restaurantBE.guests.tokens import invalidate_table_generation
+from restaurantBE.tables.events import hub
+from restaurantBE.tables.models import Table, TableDeletion
+from restaurantBE.tables.serializers import table_event
+from restaurantBE.tables.tokens import invalidate_table_tokens
+
+# Listeners away for longer reconnect and get a new snapshot anyway
+TOMBSTONE_RETENTION = timedelta(days=1)
+
+
+@receiver(post_save, sender=Table)
+def publish_table_change(sender, instance, **kwargs):
+    data = table_event(instance)
+
+    # Listeners and caches only hear about committed changes
+    def publish():
+        invalidate_table_generation(instance.number)
+        hub.publish_table(data)
+
+    transaction.on_commit(publish)
+
+
+@receiver(post_delete, sender=Table)
+def publish_table_delete(sender, instance, **kwargs):
+    # delete() clears the primary key before the transaction commits
+    number, token = instance.number, instance.token
+
+    # Same transaction as the delete, for the pollers of other processes
+    tombstone = TableDeletion.objects.create(number=number)
+    TableDeletion.objects.filter(delete_at__lt=tombstone.delete_at - TOMBSTONE_RETENTION).delete()
+
+    def publish():
+        invalidate_table_generation(number)
+        invalidate_table_tokens([token])
+        hub.publish_deleted(number, tombstone.delete_at)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,138 @@
+"""
+Server-Sent Events stream of table status changes (ASGI only)
+GET /api/tables/stream/?token=<access token>
+    or with the usual Authorization: Bearer <access token> header
+Sends a "snapshot" event with every table, then a "table" event on each
+status change and a "table_deleted" event when a table is removed.
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils.translation import gettext as _
+
+from restaurantBE.tables.events import format_event, hub
+
+STREAM_PATH = "/api/tables/stream/"
+
+
+def _get_raw_token(scope):
+    query = parse_qs(scope.get("query_string", b"").decode())
+    if query.get("token"):
+        return query["token"][0]
+
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            parts = value.decode().split()
+            if len(parts) == 2 and parts[0] == "Bearer":
+                return parts[1]
+    return None
+
+
+def _authenticate(raw_token):
+    from restaurantBE.utils.authentication import CachedJWTAuthentication
+
+    authentication = CachedJWTAuthentication()
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except Exception:
+        return None
+    finally:
+        close_old_connections()
+
+
+def _snapshot():
+    from restaurantBE.tables.models import Table
+    from restaurantBE.tables.serializers import table_event
+
+    try:
+        return [table_event(table) for table in Table.objects.order_by("number")]
+    finally:
+        close_old_connections()
+
+
+async def _send_unauthorized(send):
+    body = json.dumps(
+        {"success": False, "message": _("unauthorized"), "errors": None}
+    ).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def table_status_stream(scope, receive, send):
+    raw_token = _get_raw_token(scope)
+    user = None
+    if raw_token:
+        user = await sync_to_async(_authenticate, thread_sensitive=False)(raw_token)
+    if user is None:
+        await _send_unauthorized(send)
+        return
+
+    queue = hub.subscribe()
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                ],
+            }
+        )
+        tables = await sync_to_async(_snapshot, thread_sensitive=False)()
+        await _send_body(send, format_event("snapshot", tables))
+
+        while not disconnected.done():
+            message = asyncio.ensure_future(queue.get())
+            done, pending = await asyncio.wait(
+                {message, disconnected},
+                timeout=settings.TABLE_STREAM_KEEPALIVE,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if message in done:
+                await _send_body(send, message.result())
+            else:
+                message.cancel()
+                if not disconnected.done():
+                    await _send_body(send, b": keepalive\n\n")
+    finally:
+        hub.unsubscribe(queue)
+        disconnected.cancel()
+
+
+async def _send_body(send, body):
+    await send({"type": "http.response.body", "body": body, "more_body": True})
+
+
+async def _wait_for_disconnect(receive):
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+def with_table_stream(application):
+    """
+    Serve STREAM_PATH from table_status_stream, everything else from application.
+    """
+
+    async def router(scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == STREAM_PATH:
+            await table_status_stream(scope, receive, send)
+        else:
+            await application(scope, receive, send)
+
+    return router
@@ -1,3 +1,101 @@
+from datetime import timedelta
+from unittest import mock
+
 from django.test import TestCase
+from django.utils import timezone
+
+from restaurantBE.tables.events import TableEventHub
+from restaurantBE.tables import tokens
+from restaurantBE.tables.models import Table
+from restaurantBE.tables.tokens import get_table_number_by_token
+from restaurantBE.utils.cache import bump_version
+
+
+def published(publish):
+    # First two lines of each server-sent event: its name and data
+    return [call.args[0].decode().split("\n")[:2] for call in publish.call_args_list]
+
+
+@mock.patch("restaurantBE.tables.events.close_old_connections", mock.Mock())
+class TableEventTests(TestCase):
+    def setUp(self):
+        self.hub = TableEventHub()
+        patcher = mock.patch("restaurantBE.tables.signals.hub", self.hub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_table(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Table.objects.create(number=1, capacity=4, token="token-1")
+
+    def test_change_is_published_after_commit(self):
+        with mock.patch.object(self.hub, "publish") as publish:
+            with self.captureOnCommitCallbacks() as callbacks:
+                Table.objects.create(number=1, capacity=4, token="token-1")
+            self.assertFalse(publish.called)
+
+            for callback in callbacks:
+                callback()
+            self.assertEqual([event for event, _data in published(publish)], ["event: table"])
+
+    def test_poller_sees_delete_of_another_process(self):
+        table = self.create_table()
+        since = timezone.now() - timedelta(seconds=1)
+        # Committed elsewhere: this process' on_commit callbacks never run
+        table.delete()
+
+        other = TableEventHub()
+        with mock.patch.object(other, "publish") as publish:
+            other._publish_changes(since)
+        self.assertEqual(published(publish), [["event: table_deleted", 'data: {"number": 1}']])
+
+    def test_delete_is_published_once_in_its_process(self):
+        table = self.create_table()
+        since = timezone.now() - timedelta(seconds=1)
+
+        with mock.patch.object(self.hub, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                table.delete()
+            self.hub._publish_changes(since)
+        self.assertEqual(published(publish), [["event: table_deleted", 'data: {"number": 1}']])
+
+
+    def test_poller_sees_late_commit_and_publishes_it_once(self):
+        table = self.create_table()
+        # Committed after a poll that already moved past its update_at
+        since = table.update_at + timedelta(seconds=1)
+
+        other = TableEventHub()
+        with mock.patch.object(other, "publish") as publish:
+            since = other._publish_changes(since)
+            other._publish_changes(since)
+        self.assertEqual([event for event, _data in published(publish)], ["event: table"])
+
+    def test_recreated_table_is_not_published_again(self):
+        since = timezone.now() - timedelta(seconds=1)
+        self.create_table().delete()
+        self.create_table()
+
+        other = TableEventHub()
+        with mock.patch.object(other, "publish") as publish:
+            since = other._publish_changes(since)
+            other._publish_changes(since)
+        self.assertEqual(
+            [event for event, _data in published(publish)],
+            ["event: table_deleted", "event: table"],
+        )
+
+class TableTokenCacheTests(TestCase):
+    def setUp(self):
+        self.table = Table.objects.create(number=1, capacity=4, token="token-1")
+
+    def test_rotation_in_another_process_retires_cached_token(self):
+        self.assertEqual(get_table_number_by_token("token-1"), 1)
+
+        # What rotate_table_tokens leaves behind in another process: the new
+        # token and a new rotation version, this process' cache untouched
+        Table.objects.filter(pk=1).update(token="token-2")
+        bump_version(tokens._ROTATION_KEY)
 
-# Create your tests here.
+        self.assertIsNone(get_table_number_by_token("token-1"))
+        self.assertEqual(get_table_number_by_token("token-2"), 1)
@@ -0,0 +1,82 @@
+"""
+Table QR Tokens
+Guests check in by token alone. The unique index on Table.token resolves a
+token in one lookup and the token -> table number mapping is then kept in
+the in-process "tables" cache. The cache keys carry the rotation version
+from the shared cache, so a rotation in any process retires them all.
+"""
+
+import hashlib
+import secrets
+
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+
+from restaurantBE.guests.tokens import TABLE_CACHE_ALIAS
+from restaurantBE.tables.models import Table
+from restaurantBE.utils.cache import bump_version, get_version
+
+_ROTATION_KEY = "table:tokens:version"
+
+
+def generate_table_token():
+    return secrets.token_urlsafe(32)
+
+
+def _token_key(token, version):
+    # Tokens come from the client, hash them into a safe cache key
+    return f"table:token:{version}:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_table_number_by_token(token):
+    """
+    Number of the table a QR token belongs to, None when it is unknown.
+    """
+    cache = caches[TABLE_CACHE_ALIAS]
+    key = _token_key(token, get_version(_ROTATION_KEY))
+
+    number = cache.get(key)
+    if number is None:
+        number = (
+            Table.objects.filter(token=token)
+            .values_list("number", flat=True)
+            .first()
+        )
+        if number is None:
+            return None
+        cache.set(key, number)
+    return number
+
+
+def invalidate_table_tokens(tokens):
+    """
+    Retire the cached mappings of tokens here and, through a new rotation
+    version, every cached mapping in the other processes.
+    """
+    version = get_version(_ROTATION_KEY)
+    caches[TABLE_CACHE_ALIAS].delete_many([_token_key(token, version) for token in tokens])
+    bump_version(_ROTATION_KEY)
+
+
+def rotate_table_tokens(numbers=None):
+    """
+    Give every table (or only the given numbers) a new QR token in one bulk
+    UPDATE. Returns the number of tables rotated.
+    """
+    with transaction.atomic():
+        tables = Table.objects.select_for_update().only("number", "token")
+        if numbers is not None:
+            tables = tables.filter(number__in=numbers)
+        tables = list(tables)
+
+        old_tokens = [table.token for table in tables]
+        now = timezone.now()
+        for table in tables:
+            table.token = generate_table_token()
+            table.update_at = now
+
+        Table.objects.bulk_update(tables, ["token", "update_at"])
+        transaction.on_commit(lambda: invalidate_table_tokens(old_tokens))
+
+    return len(tables)
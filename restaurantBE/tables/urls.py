@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import TableDetailAPIView, TableListCreateAPIView, TableRevokeGuestsAPIView
+
+urlpatterns = [
+    path("tables/", TableListCreateAPIView.as_view(), name="get_tables"),
+    path("tables/<int:pk>/", TableDetailAPIView.as_view(), name="table"),
+    path(
+        "tables/<int:pk>/revoke-guests/",
+        TableRevokeGuestsAPIView.as_view(),
+        name="revoke_table_guests",
+    ),
+]
@@ -1,3 +1,171 @@
-from django.shortcuts import render
+"""
+Table Views
+Handles: Table list, create, detail, update, delete, guest revocation
+Status changes are pushed to GET /api/tables/stream/ (see stream.py)
+"""
 
-# Create your views here.
+from django.http.response import Http404
+from django.utils.translation import gettext_lazy as _
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+
+from restaurantBE.guests.tokens import revoke_table_guests
+from restaurantBE.tables.models import Table
+from restaurantBE.tables.serializers import TableSerializer
+from restaurantBE.tables.tokens import generate_table_token
+from restaurantBE.utils.permissions import IsAdmin
+from restaurantBE.utils.responses import apiError, apiStream, apiSuccess
+
+
+class TableListCreateAPIView(generics.ListCreateAPIView):
+    """
+    Get All Tables + Create New Table
+    GET /api/tables/
+    POST /api/tables/
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = TableSerializer
+    pagination_class = None
+    queryset = Table.objects.order_by("number")
+
+    def get_permissions(self):
+        if self.request.method == "POST":
+            return [IsAuthenticated(), IsAdmin()]
+        return super().get_permissions()
+
+    def perform_create(self, serializer):
+        """
+        Generate the QR token of the new table
+        """
+        serializer.save(token=generate_table_token())
+
+    def list(self, request, *args, **kwargs):
+        # Unpaginated, streamed so memory does not grow with the table count
+        return apiStream(
+            self.filter_queryset(self.get_queryset()),
+            lambda tables: self.get_serializer(tables, many=True).data,
+            msg=_("get_tables_success"),
+            status=status.HTTP_200_OK,
+        )
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return apiError(
+                serializer.errors,
+                _("validation_error"),
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        self.perform_create(serializer)
+        return apiSuccess(
+            data=serializer.data,
+            msg=_("create_table_success"),
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class TableDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+    """
+    Get, Update, Delete Table by number
+    GET /api/tables/<number>/
+    PUT /api/tables/<number>/
+    PATCH /api/tables/<number>/
+    DELETE /api/tables/<number>/
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = TableSerializer
+    queryset = Table.objects.all()
+
+    def get_permissions(self):
+        if self.request.method == "DELETE":
+            return [IsAuthenticated(), IsAdmin()]
+        return super().get_permissions()
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            instance = self.get_object()
+        except Http404:
+            return apiError(
+                None,
+                _("table_not_found"),
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = self.get_serializer(instance)
+        return apiSuccess(
+            data=serializer.data,
+            msg=_("get_table_success"),
+            status=status.HTTP_200_OK,
+        )
+
+    def update(self, request, *args, **kwargs):
+        try:
+            instance = self.get_object()
+        except Http404:
+            return apiError(
+                None,
+                _("table_not_found"),
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        data = request.data.copy()
+        # The primary key cannot change
+        data["number"] = instance.number
+
+        serializer = self.get_serializer(instance, data=data, partial=kwargs.get('partial', False))
+        if serializer.is_valid():
+            serializer.save()
+            return apiSuccess(
+                data=serializer.data,
+                msg=_("update_table_success"),
+                status=status.HTTP_200_OK,
+            )
+
+        return apiError(
+            serializer.errors,
+            _("validation_error"),
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+    def partial_update(self, request, *args, **kwargs):
+        kwargs['partial'] = True
+        return self.update(request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        try:
+            instance = self.get_object()
+        except Http404:
+            return apiError(
+                None,
+                _("table_not_found"),
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        instance.delete()
+        return apiSuccess(
+            data=None,
+            msg=_("delete_table_success"),
+            status=status.HTTP_200_OK,
+        )
+
+
+class TableRevokeGuestsAPIView(generics.GenericAPIView):
+    """
+    Revoke every guest token of a table
+    POST /api/tables/<number>/revoke-guests/
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        if not revoke_table_guests(pk):
+            return apiError(
+                None,
+                _("table_not_found"),
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return apiSuccess(
+            data=None,
+            msg=_("revoke_table_guests_success"),
+            status=status.HTTP_200_OK,
+        )
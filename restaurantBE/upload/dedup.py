@@ -0,0 +1,60 @@
+"""
+Content-hash deduplication of uploaded media
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+
+from restaurantBE.upload.models import MediaIndex
+from restaurantBE.upload.storage import get_storage
+
+
+def hash_upload(source):
+    """
+    sha256 hex digest of an uploaded file (read chunk by chunk, then rewound)
+    or of bytes.
+    """
+    if isinstance(source, bytes):
+        return hashlib.sha256(source).hexdigest()
+
+    digest = hashlib.sha256()
+    for chunk in source.chunks():
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def pipeline_fingerprint():
+    """
+    sha256 of everything that decides the stored variants and where they live
+    (variant sizes, format, quality, storage backend and its location), so
+    media stored under other settings is not reused.
+    """
+    parts = [
+        sorted(settings.UPLOAD_IMAGE_VARIANTS.items()),
+        settings.UPLOAD_IMAGE_FORMAT,
+        settings.UPLOAD_IMAGE_QUALITY,
+        settings.UPLOAD_STORAGE_BACKEND,
+        get_storage().location(),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def find_media(digest):
+    """
+    Variants stored for digest with the current pipeline, None when the
+    content is new.
+    """
+    return (
+        MediaIndex.objects.filter(sha256=digest, pipeline=pipeline_fingerprint())
+        .values_list("variants", flat=True)
+        .first()
+    )
+
+
+def remember_media(digest, variants):
+    MediaIndex.objects.get_or_create(
+        sha256=digest, pipeline=pipeline_fingerprint(), defaults={"variants": variants}
+    )
@@ -0,0 +1,97 @@
+"""
+Image processing for uploads
+Decodes an upload once and encodes capped-resolution variants of it
+"""
+
+import os
+from io import BytesIO
+
+from django.conf import settings
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+_CONTENT_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+_EXTENSIONS = {"WEBP": ".webp", "JPEG": ".jpg"}
+
+
+class InvalidImage(ValueError):
+    """
+    The upload cannot be decoded, or is over UPLOAD_IMAGE_MAX_PIXELS.
+    """
+
+
+def open_image(source):
+    """
+    Open source (file object or bytes) reading only its header. Raises
+    InvalidImage for unreadable files and for images over
+    UPLOAD_IMAGE_MAX_PIXELS: a few KB of PNG can describe a 20000x20000
+    image, and draft() only shrinks JPEG while decoding.
+    """
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+
+    try:
+        image = Image.open(source)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidImage(str(e)) from e
+
+    width, height = image.size
+    if width * height > settings.UPLOAD_IMAGE_MAX_PIXELS:
+        raise InvalidImage(
+            f"{width}x{height} is over {settings.UPLOAD_IMAGE_MAX_PIXELS} pixels"
+        )
+    return image
+
+
+def build_variants(source):
+    """
+    Return {variant: (bytes, content_type, extension)} for every entry of
+    UPLOAD_IMAGE_VARIANTS (name -> max edge in px). source is a file object
+    or bytes. Larger variants are resized first and each smaller one is
+    derived from the previous, so the full image is resampled only once.
+    Raises InvalidImage, see open_image.
+    """
+    image_format = settings.UPLOAD_IMAGE_FORMAT
+    sizes = sorted(
+        settings.UPLOAD_IMAGE_VARIANTS.items(), key=lambda item: item[1], reverse=True
+    )
+
+    image = open_image(source)
+    try:
+        # Let the JPEG decoder downscale by a power of two while decoding
+        image.draft("RGB", (sizes[0][1], sizes[0][1]))
+        image = ImageOps.exif_transpose(image)
+
+        keep_alpha = image_format == "WEBP" and image.mode in ("RGBA", "LA", "P")
+        image = image.convert("RGBA" if keep_alpha else "RGB")
+    except (Image.DecompressionBombError, OSError) as e:
+        # Truncated or corrupt pixel data
+        raise InvalidImage(str(e)) from e
+
+    variants = {}
+    for name, max_edge in sizes:
+        image.thumbnail((max_edge, max_edge), Image.LANCZOS, reducing_gap=3.0)
+
+        output = BytesIO()
+        image.save(
+            output,
+            image_format,
+            quality=settings.UPLOAD_IMAGE_QUALITY,
+            optimize=image_format == "JPEG",
+        )
+        variants[name] = (
+            output.getvalue(),
+            _CONTENT_TYPES[image_format],
+            _EXTENSIONS[image_format],
+        )
+    return variants
+
+
+def store_variants(storage, name, source):
+    """
+    Build the variants of source and save each one, returning {variant: url}.
+    """
+    stem = os.path.splitext(name)[0]
+    return {
+        variant: storage.save(f"{stem}_{variant}{extension}", content, content_type)
+        for variant, (content, content_type, extension) in build_variants(source).items()
+    }
@@ -0,0 +1,80 @@
+"""
+Background upload pipeline
+Uploads are handed to a bounded thread pool, job state lives in UploadJob
+so any worker process can answer a status poll.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from restaurantBE.constants.roles import UploadStatus
+from restaurantBE.upload.dedup import remember_media
+from restaurantBE.upload.images import InvalidImage, store_variants
+from restaurantBE.upload.models import UploadJob
+from restaurantBE.upload.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_executor = None
+_slots = None
+
+
+def _get_pool():
+    global _executor, _slots
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.UPLOAD_WORKERS, thread_name_prefix="upload"
+            )
+            _slots = threading.BoundedSemaphore(settings.UPLOAD_MAX_PENDING)
+    return _executor, _slots
+
+
+def submit_upload(job, name, content, content_type=None, digest=None):
+    """
+    Queue the transfer of content for job. Returns False, without queueing,
+    when UPLOAD_MAX_PENDING uploads are already waiting or running.
+    When digest is given the stored variants are added to the media index.
+    """
+    executor, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        return False
+
+    try:
+        executor.submit(_run_upload, job.pk, name, content, content_type, digest)
+    except Exception:
+        slots.release()
+        raise
+    return True
+
+
+def _run_upload(job_id, name, content, content_type, digest):
+    try:
+        variants = store_variants(get_storage(), name, content)
+        if digest:
+            remember_media(digest, variants)
+        UploadJob.objects.filter(pk=job_id).update(
+            status=UploadStatus.DONE,
+            url=variants.get("original"),
+            variants=variants,
+            update_at=timezone.now(),
+        )
+    except InvalidImage as e:
+        logger.info("Upload job %s rejected: %s", job_id, e)
+        UploadJob.objects.filter(pk=job_id).update(
+            status=UploadStatus.FAILED, error="invalid_image", update_at=timezone.now()
+        )
+    except Exception as e:
+        logger.exception("Upload job %s failed", job_id)
+        UploadJob.objects.filter(pk=job_id).update(
+            status=UploadStatus.FAILED, error=str(e), update_at=timezone.now()
+        )
+    finally:
+        _slots.release()
+        close_old_connections()
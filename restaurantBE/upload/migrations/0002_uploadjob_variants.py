@@ -0,0 +1,18 @@
+# Generated by Django 3.2.14 on 2026-10-18 13:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadjob',
+            name='variants',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.14 on 2026-10-18 13:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0002_uploadjob_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('variants', models.JSONField()),
+                ('create_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'MediaIndex',
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.14 on 2026-10-18 14:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0003_mediaindex'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaindex',
+            name='pipeline',
+            field=models.CharField(default='', max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='mediaindex',
+            name='sha256',
+            field=models.CharField(max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name='mediaindex',
+            constraint=models.UniqueConstraint(fields=('sha256', 'pipeline'), name='media_index_sha256_pipeline_uniq'),
+        ),
+    ]
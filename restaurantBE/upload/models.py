@@ -1,3 +1,48 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from restaurantBE.constants.roles import UploadStatus
+
+
+class UploadJob(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    status = models.CharField(
+        max_length=20, choices=UploadStatus.choices, default=UploadStatus.PENDING
+    )
+    url = models.CharField(max_length=500, blank=True, null=True)
+    # {variant: url}, url above is the "original" variant
+    variants = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+    create_at = models.DateTimeField(auto_now_add=True)
+    update_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "UploadJob"
+
+    def __str__(self):
+        return f"Upload {self.id} ({self.status})"
+
+
+class MediaIndex(models.Model):
+    # (sha256 of the uploaded bytes, pipeline) -> variants already stored for them
+    sha256 = models.CharField(max_length=64)
+    # Fingerprint of the variant settings and storage, see dedup.pipeline_fingerprint
+    pipeline = models.CharField(max_length=64, default="")
+    variants = models.JSONField()
+    create_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "MediaIndex"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sha256", "pipeline"], name="media_index_sha256_pipeline_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return self.sha256
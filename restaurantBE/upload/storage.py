@@ -0,0 +1,72 @@
+"""
+Storage backends for uploaded media
+Select one with the UPLOAD_STORAGE_BACKEND setting (dotted path)
+"""
+
+import os
+import uuid
+from functools import lru_cache
+from io import BytesIO
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class BaseStorage:
+    def save(self, name, content, content_type=None):
+        """
+        Store content (bytes) and return its public URL.
+        """
+        raise NotImplementedError
+
+    def location(self):
+        """
+        Where saved files end up, part of the media index fingerprint.
+        """
+        return ""
+
+
+class CloudinaryStorage(BaseStorage):
+    folder = "uploads"
+
+    def save(self, name, content, content_type=None):
+        import cloudinary.uploader
+
+        result = cloudinary.uploader.upload(
+            BytesIO(content),
+            folder=self.folder,
+            resource_type="auto",
+        )
+        return result.get("secure_url") or result.get("url")
+
+    def location(self):
+        import cloudinary
+
+        return f"{cloudinary.config().cloud_name}/{self.folder}"
+
+
+class LocalStorage(BaseStorage):
+    """
+    Writes files under MEDIA_ROOT, for offline development and tests.
+    """
+
+    folder = "uploads"
+
+    def save(self, name, content, content_type=None):
+        extension = os.path.splitext(name)[1].lower()
+        relative = f"{self.folder}/{uuid.uuid4().hex}{extension}"
+        path = os.path.join(settings.MEDIA_ROOT, relative)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as destination:
+            destination.write(content)
+
+        return settings.HOST.rstrip("/") + settings.MEDIA_URL + relative
+
+    def location(self):
+        return f"{settings.MEDIA_ROOT}|{settings.HOST.rstrip('/')}{settings.MEDIA_URL}{self.folder}"
+
+
+@lru_cache(maxsize=None)
+def get_storage():
+    return import_string(settings.UPLOAD_STORAGE_BACKEND)()
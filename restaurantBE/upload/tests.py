@@ -1,3 +1,113 @@
-from django.test import TestCase
+import struct
+import tempfile
+import zlib
+from io import BytesIO
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from restaurantBE.accounts.models import Account
+from restaurantBE.constants.roles import UploadStatus
+from restaurantBE.upload import jobs
+from restaurantBE.upload.models import MediaIndex, UploadJob
+
+
+def png_claiming(width, height):
+    """
+    A tiny PNG whose header claims width x height pixels.
+    """
+    output = BytesIO()
+    Image.new("1", (1, 1)).save(output, "PNG")
+    data = bytearray(output.getvalue())
+    # Signature (8) + IHDR length (4) + "IHDR" (4), then width and height
+    data[16:24] = struct.pack(">II", width, height)
+    data[29:33] = struct.pack(">I", zlib.crc32(bytes(data[12:29])))
+    return bytes(data)
+
+
+def png(width, height):
+    output = BytesIO()
+    Image.new("RGB", (width, height), "red").save(output, "PNG")
+    return output.getvalue()
+
+
+@override_settings(
+    UPLOAD_STORAGE_BACKEND="restaurantBE.upload.storage.LocalStorage",
+    MEDIA_ROOT=tempfile.mkdtemp(),
+)
+class OversizedImageTests(TestCase):
+    def setUp(self):
+        self.account = Account.objects.create_user("admin@restaurant.vn", "Admin", "secret!aa1")
+        self.client = APIClient()
+        self.client.force_authenticate(self.account)
+
+    def upload(self, path, content):
+        return self.client.post(
+            path,
+            {"file": SimpleUploadedFile("bomb.png", content, content_type="image/png")},
+            format="multipart",
+        )
+
+    def test_sync_upload_rejects_oversized_image(self):
+        response = self.upload("/api/media/upload/", png_claiming(20000, 20000))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_async_upload_rejects_oversized_image(self):
+        response = self.upload("/api/media/upload/async/", png_claiming(20000, 20000))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(UploadJob.objects.exists())
+
+    @override_settings(UPLOAD_IMAGE_MAX_PIXELS=100)
+    def test_upload_under_pillow_limit_is_capped(self):
+        response = self.upload("/api/media/upload/", png(20, 20))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_small_image_is_stored(self):
+        response = self.upload("/api/media/upload/", png(20, 20))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_job_runner_marks_oversized_image_failed(self):
+        job = UploadJob.objects.create(owner=self.account)
+        _, slots = jobs._get_pool()
+        slots.acquire()
+
+        jobs._run_upload(job.pk, "bomb.png", png_claiming(20000, 20000), "image/png", None)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UploadStatus.FAILED)
+        self.assertEqual(job.error, "invalid_image")
+
+
+@override_settings(
+    UPLOAD_STORAGE_BACKEND="restaurantBE.upload.storage.LocalStorage",
+    MEDIA_ROOT=tempfile.mkdtemp(),
+)
+class MediaIndexTests(TestCase):
+    def setUp(self):
+        account = Account.objects.create_user("admin@restaurant.vn", "Admin", "secret!aa1")
+        self.client = APIClient()
+        self.client.force_authenticate(account)
+
+    def upload(self):
+        response = self.client.post(
+            "/api/media/upload/",
+            {"file": SimpleUploadedFile("dish.png", png(20, 20), content_type="image/png")},
+            format="multipart",
+        )
+        self.assertIn(response.status_code, (status.HTTP_200_OK, status.HTTP_201_CREATED))
+        return response.json()["data"]
+
+    def test_same_content_is_reused(self):
+        self.assertEqual(self.upload(), self.upload())
+        self.assertEqual(MediaIndex.objects.count(), 1)
+
+    def test_pipeline_change_stores_again(self):
+        self.upload()
+        with override_settings(UPLOAD_IMAGE_QUALITY=50):
+            self.upload()
+        with override_settings(HOST="https://cdn.restaurant.vn"):
+            self.upload()
+        self.assertEqual(MediaIndex.objects.count(), 3)
@@ -1,6 +1,9 @@
 from django.urls import path
-from .views import UploadImageView
+from restaurantBE.utils.async_views import asgi_view
+from .views import AsyncUploadImageView, UploadImageView, UploadJobStatusView
 
 urlpatterns = [
-    path("media/upload/", UploadImageView.as_view()),
+    path("media/upload/", asgi_view(UploadImageView.as_view())),
+    path("media/upload/async/", asgi_view(AsyncUploadImageView.as_view()), name="upload_async"),
+    path("media/upload/jobs/<uuid:job_id>/", asgi_view(UploadJobStatusView.as_view()), name="upload_job"),
 ]
@@ -5,7 +5,35 @@ from rest_framework.parsers import MultiPartParser
 from rest_framework import status
 from django.utils.translation import gettext as _
 from restaurantBE.constants.common import Constant
-import cloudinary.uploader
+from restaurantBE.constants.roles import UploadStatus
+from restaurantBE.upload.dedup import find_media, hash_upload, remember_media
+from restaurantBE.upload.images import InvalidImage, open_image, store_variants
+from restaurantBE.upload.jobs import submit_upload
+from restaurantBE.upload.models import UploadJob
+from restaurantBE.upload.storage import get_storage
+
+
+def validate_image(file):
+    """
+    Return the error message for an invalid upload, None when it is valid.
+    """
+    if not file:
+        return "no_file_provided"
+    if file.size > Constant.MAX_FILE_SIZE:
+        return "file_too_large"
+    if file.content_type not in Constant.ALLOWED_IMAGE_FORMATS:
+        return "file_type_not_allowed"
+    return None
+
+
+def serialize_job(job):
+    return {
+        "jobId": str(job.id),
+        "status": job.status,
+        "url": job.url,
+        "variants": job.variants,
+        "error": job.error,
+    }
 
 
 class UploadImageView(APIView):
@@ -15,17 +43,81 @@ class UploadImageView(APIView):
     
     def post(self, request):
         file = request.FILES.get('file')
-        if not file:
-            return apiError(None, _("no_file_provided"), status=status.HTTP_400_BAD_REQUEST)
-        if file.size > Constant.MAX_FILE_SIZE:
-            return apiError(None, _("file_too_large"), status=status.HTTP_400_BAD_REQUEST)
-        if file.content_type not in Constant.ALLOWED_IMAGE_FORMATS:
-            return apiError(None, _("file_type_not_allowed"), status=status.HTTP_400_BAD_REQUEST)
-        
-        result = cloudinary.uploader.upload(
-            file,
-            folder="uploads",
-            resource_type="auto"  
-        )
-        image_url = result.get('secure_url') or result.get('url')
-        return apiSuccess(image_url, _("file_uploaded_successfully"), status=status.HTTP_201_CREATED)
\ No newline at end of file
+        error = validate_image(file)
+        if error:
+            return apiError(None, _(error), status=status.HTTP_400_BAD_REQUEST)
+
+        digest = hash_upload(file)
+        variants = find_media(digest)
+        if variants is not None:
+            # Same bytes were uploaded before, reuse the stored variants
+            return apiSuccess(variants, _("file_uploaded_successfully"), status=status.HTTP_200_OK)
+
+        try:
+            # Decoded straight from the uploaded file, variants are what get stored
+            variants = store_variants(get_storage(), file.name, file)
+        except InvalidImage:
+            return apiError(None, _("invalid_image"), status=status.HTTP_400_BAD_REQUEST)
+
+        remember_media(digest, variants)
+        return apiSuccess(variants, _("file_uploaded_successfully"), status=status.HTTP_201_CREATED)
+
+
+class AsyncUploadImageView(APIView):
+    """
+    Queue an upload and return at once
+    POST /api/media/upload/async/
+    Poll GET /api/media/upload/jobs/<jobId>/ for the URL
+    """
+    parser_classes = [MultiPartParser]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        file = request.FILES.get('file')
+        error = validate_image(file)
+        if error:
+            return apiError(None, _(error), status=status.HTTP_400_BAD_REQUEST)
+
+        # Read now: the temporary upload file is gone once the request ends
+        content = file.read()
+        try:
+            # Header only, so unreadable and oversized images fail here with a 400
+            open_image(content)
+        except InvalidImage:
+            return apiError(None, _("invalid_image"), status=status.HTTP_400_BAD_REQUEST)
+        digest = hash_upload(content)
+
+        variants = find_media(digest)
+        if variants is not None:
+            # Same bytes were uploaded before, the job is done without a transfer
+            job = UploadJob.objects.create(
+                owner=request.user,
+                status=UploadStatus.DONE,
+                url=variants.get("original"),
+                variants=variants,
+            )
+            return apiSuccess(serialize_job(job), _("upload_queued"), status=status.HTTP_202_ACCEPTED)
+
+        job = UploadJob.objects.create(owner=request.user)
+        if not submit_upload(job, file.name, content, file.content_type, digest):
+            job.delete()
+            return apiError(
+                None, _("upload_queue_full"), status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        return apiSuccess(serialize_job(job), _("upload_queued"), status=status.HTTP_202_ACCEPTED)
+
+
+class UploadJobStatusView(APIView):
+    """
+    Upload job status
+    GET /api/media/upload/jobs/<jobId>/
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        job = UploadJob.objects.filter(pk=job_id, owner=request.user).first()
+        if job is None:
+            return apiError(None, _("upload_job_not_found"), status=status.HTTP_404_NOT_FOUND)
+
+        return apiSuccess(serialize_job(job), _("get_upload_job_success"), status=status.HTTP_200_OK)
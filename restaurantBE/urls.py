@@ -1,19 +1,19 @@
 from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import HttpResponse
 from django.urls import include, path, re_path
 
-from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
 from rest_framework import permissions
 
+from restaurantBE.docs.schema import API_INFO
+from restaurantBE.docs.views import docs_view, openapi_schema_view
+from restaurantBE.metrics.views import metrics_view
+
 schema_view = get_schema_view(
-    openapi.Info(
-        title="RestaurantBE API",
-        default_version="v1",
-        contact=openapi.Contact(email="dscdut@gmail.com"),
-    ),
+    API_INFO,
     url=settings.HOST + "api/",
     public=True,
     permission_classes=[permissions.AllowAny],
@@ -22,11 +22,23 @@ urlpatterns = [
     # swagger docs
     re_path(
         r"^docs/$",
-        schema_view.with_ui("swagger", cache_timeout=0),
+        docs_view(schema_view.with_ui("swagger", cache_timeout=0)),
         name="schema-swagger-ui",
     ),
+    re_path(
+        r"^docs/openapi\.(?P<format>json|yaml)$",
+        openapi_schema_view,
+        name="schema-openapi",
+    ),
     path("admin/", admin.site.urls),
+    # Prometheus scrape target
+    re_path(r"^metrics/?$", metrics_view, name="metrics"),
     # api route
     path("api/", include("restaurantBE.accounts.urls"), name="accounts"),
     path("api/", include("restaurantBE.upload.urls"), name="upload"),
+    path("api/", include("restaurantBE.tables.urls"), name="tables"),
+    path("api/", include("restaurantBE.guests.urls"), name="guests"),
 ]
+
+# Local storage backend files, only served when DEBUG is on
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,36 @@
+"""
+Middleware that runs natively under both WSGI and ASGI
+"""
+
+import asyncio
+
+
+class AsyncCapableMiddleware:
+    """
+    Base of the middleware classes wrapping the whole request. Under ASGI, Django
+    3.2 runs a sync-only middleware, and everything below it, on the one
+    thread of sync_to_async(thread_sensitive=True), so requests are served
+    one at a time. Subclasses implement handle() for WSGI and __acall__()
+    for ASGI, the one matching get_response is used.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    @property
+    def _is_coroutine(self):
+        # asyncio.iscoroutinefunction(self) is what Django checks, as with MiddlewareMixin
+        if asyncio.iscoroutinefunction(self.get_response):
+            return asyncio.coroutines._is_coroutine
+        return None
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
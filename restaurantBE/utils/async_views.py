@@ -0,0 +1,154 @@
+"""
+Async wrappers for DRF views, used when served over ASGI
+Django 3.2 runs every sync view of an ASGI process on one shared thread;
+coroutine views built here run the DRF view in a thread pool instead, so
+requests waiting on the DB or on storage do not queue behind each other.
+StreamingResponse bodies are produced off the event loop, see ASGIHandler.
+"""
+
+import asyncio
+import functools
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler as DjangoASGIHandler
+from django.db import close_old_connections, connections
+from django.http import StreamingHttpResponse
+
+_configured_loops = weakref.WeakSet()
+
+
+def _ensure_executor(loop):
+    # Size the loop's default executor, used by sync_to_async(thread_sensitive=False)
+    if loop not in _configured_loops:
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=settings.ASGI_THREADS, thread_name_prefix="asgi")
+        )
+        _configured_loops.add(loop)
+
+
+def asgi_view(view):
+    """
+    Return a coroutine version of view (e.g. LoginAPIView.as_view()) when
+    ASYNC_VIEWS is on, the view itself otherwise.
+    """
+    if not settings.ASYNC_VIEWS:
+        return view
+
+    def run(request, *args, **kwargs):
+        # Pool threads are outside request_started/finished, manage connections here
+        close_old_connections()
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, "render") and callable(response.render):
+                response.render()
+            return response
+        finally:
+            close_old_connections()
+
+    run_in_pool = sync_to_async(run, thread_sensitive=False)
+
+    async def async_view(request, *args, **kwargs):
+        _ensure_executor(asyncio.get_running_loop())
+        return await run_in_pool(request, *args, **kwargs)
+
+    # Keeps csrf_exempt, cls and initkwargs for the middleware and drf_yasg
+    functools.update_wrapper(async_view, view)
+    return async_view
+
+
+_DONE = object()
+
+
+def _produce(iterator, items, stopped):
+    try:
+        for item in iterator:
+            while not stopped.is_set():
+                try:
+                    items.put(item, timeout=1)
+                    break
+                except queue.Full:
+                    continue
+            else:
+                return
+        items.put(_DONE)
+    except BaseException as e:
+        items.put(e)
+    finally:
+        # The cursor lived in this thread, so did its connection
+        connections.close_all()
+
+
+class StreamingResponse(StreamingHttpResponse):
+    """
+    StreamingHttpResponse safe for both servers. Under WSGI the body is
+    iterated directly. Under ASGI, ASGIHandler reads it with async for:
+    it is produced in its own thread (queryset access is refused in the
+    event loop), at most prefetch parts ahead, and the loop awaits each
+    part instead of blocking on it.
+    """
+
+    def __init__(self, streaming_content=(), *args, prefetch=4, **kwargs):
+        super().__init__(streaming_content, *args, **kwargs)
+        self.prefetch = prefetch
+
+    async def __aiter__(self):
+        items = queue.Queue(maxsize=self.prefetch)
+        stopped = threading.Event()
+        threading.Thread(
+            target=_produce,
+            args=(iter(self), items, stopped),
+            name="stream-body",
+            daemon=True,
+        ).start()
+        get = sync_to_async(items.get, thread_sensitive=False)
+        try:
+            while True:
+                item = await get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Client gone or body finished, let the producer exit
+            stopped.set()
+
+
+class ASGIHandler(DjangoASGIHandler):
+    """
+    Django's ASGIHandler, except that StreamingResponse bodies are read
+    with async for: Django 3.2 iterates streaming bodies synchronously, in
+    the event loop, so any wait for the next part stalls every request.
+    """
+
+    async def send_response(self, response, send):
+        if not isinstance(response, StreamingResponse):
+            return await super().send_response(response, send)
+
+        headers = [
+            (
+                header.encode("ascii") if isinstance(header, str) else bytes(header),
+                value.encode("latin1") if isinstance(value, str) else bytes(value),
+            )
+            for header, value in response.items()
+        ]
+        for cookie in response.cookies.values():
+            headers.append((b"Set-Cookie", cookie.output(header="").encode("ascii").strip()))
+        await send(
+            {"type": "http.response.start", "status": response.status_code, "headers": headers}
+        )
+
+        parts = response.__aiter__()
+        try:
+            async for part in parts:
+                for chunk, _ in self.chunk_bytes(part):
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            await parts.aclose()
+        await send({"type": "http.response.body"})
+        await sync_to_async(response.close, thread_sensitive=True)()
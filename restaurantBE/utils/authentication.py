@@ -0,0 +1,70 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from restaurantBE.accounts.services import get_cached_account, is_token_revoked
+from restaurantBE.guests.tokens import GuestAccessToken, GuestUser, verify_guest_token
+
+
+class GenerationJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that also rejects access tokens of an older
+    token_generation (before a logout), so access tokens need no DB rows.
+    """
+
+    def get_user(self, validated_token):
+        user = self.get_account(validated_token)
+
+        if is_token_revoked(user, validated_token):
+            raise AuthenticationFailed(_("token_revoked"), code="token_revoked")
+
+        return user
+
+    def get_account(self, validated_token):
+        return super().get_user(validated_token)
+
+
+class CachedJWTAuthentication(GenerationJWTAuthentication):
+    """
+    Generation JWT authentication that builds the user from the in-process
+    account cache, checked against the token's role and gen claims and the
+    account's shared version. A request reads no account row while those
+    agree.
+    """
+
+    def get_account(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("invalid_token"))
+
+        user = get_cached_account(user_id, validated_token)
+        if user is None:
+            raise AuthenticationFailed(_("user_not_found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("user_inactive"), code="user_inactive")
+
+        return user
+
+
+class GuestJWTAuthentication(JWTAuthentication):
+    """
+    Authenticates table guests from self-contained guest access tokens.
+    Only the table's cached guest_generation is checked, no guest row is read.
+    """
+
+    def get_validated_token(self, raw_token):
+        try:
+            return GuestAccessToken(raw_token)
+        except TokenError:
+            raise InvalidToken(_("invalid_token"))
+
+    def get_user(self, validated_token):
+        try:
+            verify_guest_token(validated_token)
+        except TokenError:
+            raise AuthenticationFailed(_("guest_token_revoked"), code="guest_token_revoked")
+
+        return GuestUser(validated_token)
@@ -0,0 +1,28 @@
+"""
+Shared cache versions
+The account and table caches are per process (locmem). Each entry is stored
+with the version key it was built under, read from the "shared" cache that
+every worker sees; bumping the key invalidates the entry in every process.
+"""
+
+import uuid
+
+from django.core.cache import caches
+
+SHARED_CACHE_ALIAS = "shared"
+
+
+def get_version(key):
+    """
+    Current version of key, None until it is first bumped.
+    """
+    return caches[SHARED_CACHE_ALIAS].get(key)
+
+
+def bump_version(key):
+    """
+    Give key a new version, so entries built under the old one are rebuilt.
+    """
+    version = uuid.uuid4().hex
+    caches[SHARED_CACHE_ALIAS].set(key, version, None)
+    return version
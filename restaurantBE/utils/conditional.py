@@ -0,0 +1,56 @@
+"""
+Conditional GET: ETag / Last-Modified validators computed before the view
+serializes anything, so an unchanged resource answers 304 Not Modified.
+"""
+
+import hashlib
+from calendar import timegm
+
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+from restaurantBE.utils.messages import get_request_language
+
+
+def make_etag(*parts):
+    """
+    Weak ETag of the parts and the request language (envelope messages are
+    translated, so each language is a different representation).
+    """
+    key = "|".join(str(part) for part in (*parts, get_request_language()))
+    return f'W/"{hashlib.md5(key.encode()).hexdigest()}"'
+
+
+def _timestamp(last_modified):
+    return int(timegm(last_modified.utctimetuple())) if last_modified else None
+
+
+def not_modified(request, etag, last_modified=None):
+    """
+    304 response when the request's If-None-Match / If-Modified-Since match
+    the validators, otherwise None.
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=_timestamp(last_modified)
+    )
+    if response is None:
+        return None
+    return with_validators(response, etag, last_modified)
+
+
+def with_validators(response, etag, last_modified=None):
+    """
+    Set the validators on a response. Bodies are per user: private, and
+    always revalidated.
+    """
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(_timestamp(last_modified))
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization",))
+    return response
@@ -1,4 +1,14 @@
-from rest_framework.pagination import LimitOffsetPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomPagination(LimitOffsetPagination):
@@ -9,3 +19,142 @@ class CustomPagination(LimitOffsetPagination):
     max_offset = 50
     limit_query_param = "limit"
     offset_query_param = "page"
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on the ordering columns instead of using
+    OFFSET, so every page costs the same whatever its depth.
+    The total count is only computed when include_count is set on the class
+    or the client sends ?count=true.
+    The ordering comes from the view's ordering attribute, like DRF's
+    CursorPagination, falling back to the class default. ?page= of the
+    previous offset pagination is rejected with a 400.
+    """
+
+    default_limit = 10
+    max_limit = 100
+    limit_query_param = "limit"
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    page_query_param = "page"
+    # All fields must share one direction and end with a unique column
+    ordering = ("-create_at", "-id")
+    include_count = False
+    invalid_cursor_message = _("invalid_cursor")
+    page_not_supported_message = _("page_not_supported")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_query_param in request.query_params:
+            raise ValidationError({self.page_query_param: [self.page_not_supported_message]})
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.count = queryset.count() if self.get_include_count(request) else None
+
+        ordering = self.get_ordering(view)
+        fields = [field.lstrip("-") for field in ordering]
+        descending = ordering[0].startswith("-")
+
+        position = self.decode_cursor(request, queryset.model, fields)
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(fields, position, descending))
+
+        results = list(queryset.order_by(*ordering)[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        results = results[: self.limit]
+
+        self.next_position = None
+        if self.has_next:
+            last = results[-1]
+            if isinstance(last, dict):
+                self.next_position = [last[field] for field in fields]
+            else:
+                self.next_position = [getattr(last, field) for field in fields]
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_next_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer", "nullable": True},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_ordering(self, view):
+        ordering = getattr(view, "ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+
+        directions = {field.startswith("-") for field in ordering}
+        if len(directions) != 1:
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} ordering {ordering!r} must share one direction"
+            )
+        return tuple(ordering)
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def get_include_count(self, request):
+        value = request.query_params.get(self.count_query_param, "")
+        return self.include_count or value.lower() in ("1", "true")
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def seek_filter(self, fields, position, descending):
+        """
+        (a, b) < (x, y) expanded to a < x OR (a = x AND b < y).
+        """
+        lookup = "lt" if descending else "gt"
+        condition = Q()
+        for index, field in enumerate(fields):
+            clause = Q(**{f"{field}__{lookup}": position[index]})
+            for previous, value in zip(fields[:index], position[:index]):
+                clause &= Q(**{previous: value})
+            condition |= clause
+        return condition
+
+    def encode_cursor(self, position):
+        # str() keeps full datetime precision, to_python() parses it back
+        raw = json.dumps(position, default=str)
+        return urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, request, model, fields):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(urlsafe_b64decode(encoded.encode()).decode())
+            if len(values) != len(fields):
+                raise ValueError
+            return [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(fields, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
@@ -3,7 +3,13 @@ from rest_framework import status
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from django.utils.translation import gettext_lazy as _
 
-from restaurantBE.utils.responses import apiError
+from restaurantBE.utils.messages import message
+
+# Envelope message per status, the DRF error details become "errors"
+ERROR_MESSAGES = {
+    status.HTTP_401_UNAUTHORIZED: "unauthorized",
+    status.HTTP_400_BAD_REQUEST: "bad_request",
+}
 
 
 def CustomExceptionHandler(exc, context):
@@ -12,29 +18,27 @@ def CustomExceptionHandler(exc, context):
     if response is None:
         return response
 
-    if response.status_code == status.HTTP_401_UNAUTHORIZED:
-        return apiError(
-            errors=response.data,
-            msg="unauthorized",
-            status=status.HTTP_401_UNAUTHORIZED,
-        )
-
-    if response.status_code == status.HTTP_400_BAD_REQUEST:
-        return apiError(
-            errors=response.data,
-            msg="bad_request",
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+    # The envelope replaces the data of DRF's response, which keeps its
+    # headers (WWW-Authenticate, Retry-After, ...)
+    msgid = ERROR_MESSAGES.get(response.status_code)
+    if msgid is not None:
+        response.data = {
+            "success": False,
+            "message": message(msgid),
+            "errors": response.data,
+        }
+        return response
 
     if response.status_code == status.HTTP_403_FORBIDDEN:
         msg = response.data.get("detail", "permission_denied")
         if isinstance(msg, list) and len(msg) > 0:
             msg = msg[0]
-            
-        return apiError(
-            errors=None,
-            msg=str(msg),
-            status=status.HTTP_403_FORBIDDEN,
-        )
+
+        response.data = {
+            "success": False,
+            "message": message(str(msg)),
+            "errors": None,
+        }
+        return response
 
     return response
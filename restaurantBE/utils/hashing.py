@@ -0,0 +1,75 @@
+"""
+Password hashing across processes
+PBKDF2 is CPU bound and holds the GIL, so a batch of passwords is hashed in a
+process pool. The pool is started once per process with the spawn method:
+forking a process that runs threads (gthread/ASGI workers, background
+tasks) can leave the child stuck on a lock held by another thread. This
+module imports no models: spawned workers import it before Django is set up.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+# Below this many passwords handing them to the pool costs more than it saves
+PARALLEL_HASH_MIN = 8
+
+_lock = threading.Lock()
+_executor = None
+
+
+def _init_worker(settings_module):
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+def _worker_count():
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+def _get_pool():
+    global _executor
+    with _lock:
+        if _executor is None:
+            # Workers are started on demand and then reused by every batch
+            _executor = ProcessPoolExecutor(
+                max_workers=_worker_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", ""),),
+            )
+    return _executor
+
+
+def _discard_pool(executor):
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def hash_passwords(passwords):
+    """
+    make_password() for every password, in the same order.
+    """
+    passwords = list(passwords)
+    workers = min(_worker_count(), len(passwords))
+    if len(passwords) < PARALLEL_HASH_MIN or workers < 2:
+        return [make_password(password) for password in passwords]
+
+    executor = _get_pool()
+    chunksize = max(1, len(passwords) // (workers * 4))
+    try:
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+    except BrokenProcessPool:
+        # A worker died, the next batch starts a new pool
+        _discard_pool(executor)
+        raise
@@ -0,0 +1,120 @@
+"""
+Translated API messages
+apiSuccess/apiError resolve their message through a per-language table
+instead of calling gettext on every response. preload_messages() fills it
+at startup with every msgid of the locale/ catalogs, other messages are
+remembered on first use up to MAX_MESSAGES per language.
+The language comes from a ContextVar set once per request by
+utils.middleware.LocaleMiddleware: translation.get_language() goes through
+asgiref's Local, which costs more than the gettext lookup itself.
+"""
+
+import os
+import re
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.utils import translation
+from django.utils.functional import Promise
+
+from restaurantBE.utils.renderers import dumps
+
+MAX_MESSAGES = 2048
+
+_MSGID = re.compile(r'^msgid "(.+)"$', re.MULTILINE)
+
+_request_language = ContextVar("request_language", default=None)
+
+# language -> {msgid: translated message}
+_messages = {}
+# language -> {msgid: encoded head of a streamed envelope}
+_stream_heads = {}
+
+
+def catalog_msgids():
+    """
+    Every msgid of the project's django.po files.
+    """
+    msgids = set()
+    for path in settings.LOCALE_PATHS:
+        for language, _name in settings.LANGUAGES:
+            po = os.path.join(path, language, "LC_MESSAGES", "django.po")
+            if os.path.exists(po):
+                with open(po, encoding="utf-8") as catalog:
+                    msgids.update(_MSGID.findall(catalog.read()))
+    return msgids
+
+
+def set_request_language(language):
+    _request_language.set(language)
+
+
+def get_request_language():
+    # Outside a request (commands, threads) fall back to the active language
+    return _request_language.get() or translation.get_language()
+
+
+def preload_messages():
+    """
+    Load the catalogs of every language in LANGUAGES and resolve all their
+    msgids, so requests never reach gettext for them.
+    """
+    msgids = catalog_msgids()
+    for language, _name in settings.LANGUAGES:
+        with translation.override(language):
+            table = _messages.setdefault(language, {})
+            for msgid in msgids:
+                table[msgid] = translation.gettext(msgid)
+
+
+def _lazy_msgid(promise):
+    """
+    The msgid of a gettext_lazy() string, None for other lazy objects
+    (pgettext_lazy, ngettext_lazy, format_lazy) which resolve themselves.
+    """
+    args = getattr(promise, "_proxy____args", None)
+    if getattr(promise, "_proxy____kw", None) or not args or len(args) != 1:
+        return None
+    return args[0] if isinstance(args[0], str) else None
+
+
+def message(msgid):
+    """
+    gettext(msgid) in the active language, memoized.
+    """
+    if isinstance(msgid, Promise):
+        lazy_msgid = _lazy_msgid(msgid)
+        if lazy_msgid is None:
+            return str(msgid)
+        msgid = lazy_msgid
+
+    language = get_request_language()
+    table = _messages.setdefault(language, {})
+    try:
+        return table[msgid]
+    except KeyError:
+        with translation.override(language):
+            resolved = translation.gettext(msgid)
+        if len(table) < MAX_MESSAGES:
+            table[msgid] = resolved
+        return resolved
+
+
+def stream_head(msgid):
+    """
+    Encoded start of a streamed success envelope, up to the data list.
+    """
+    if isinstance(msgid, Promise):
+        lazy_msgid = _lazy_msgid(msgid)
+        if lazy_msgid is None:
+            return b'{"success":true,"message":%s,"data":[' % dumps(str(msgid))
+        msgid = lazy_msgid
+
+    heads = _stream_heads.setdefault(get_request_language(), {})
+    try:
+        return heads[msgid]
+    except KeyError:
+        head = b'{"success":true,"message":%s,"data":[' % dumps(message(msgid))
+        if len(heads) < MAX_MESSAGES:
+            heads[msgid] = head
+        return head
@@ -0,0 +1,39 @@
+from asgiref.sync import sync_to_async
+from django.middleware.locale import LocaleMiddleware as DjangoLocaleMiddleware
+from django.utils import translation
+from whitenoise.middleware import WhiteNoiseMiddleware as BaseWhiteNoiseMiddleware
+
+from restaurantBE.utils.async_middleware import AsyncCapableMiddleware
+from restaurantBE.utils.messages import set_request_language
+
+
+class WhiteNoiseMiddleware(AsyncCapableMiddleware, BaseWhiteNoiseMiddleware):
+    """
+    WhiteNoise's middleware (sync only in 6.x) that also runs natively
+    under ASGI.
+    """
+
+    handle = BaseWhiteNoiseMiddleware.__call__
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(
+                request.path_info
+            )
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # Opens and stats the file
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
+
+
+class LocaleMiddleware(DjangoLocaleMiddleware):
+    """
+    Django's LocaleMiddleware that also hands the request language to the
+    message table, see utils/messages.py.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        set_request_language(translation.get_language())
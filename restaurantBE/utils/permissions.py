@@ -18,3 +18,12 @@ class IsEmployee(BasePermission):
 
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_authenticated and request.user.role == Role.EMPLOYEE)
+
+class IsGuest(BasePermission):
+    """
+    Allows access only to table guests.
+    """
+    message = "guest_required"
+
+    def has_permission(self, request, view):
+        return bool(request.user and getattr(request.user, "is_guest", False))
@@ -0,0 +1,191 @@
+"""
+Per-request profiling
+ProfilingMiddleware records, for a sample of requests, the wall time, the
+number and total time of DB queries, the time spent in serializers and in
+the renderer, and the response size. They are sent back as Server-Timing
+and logged as one JSON line on the "restaurantBE.profiling" logger.
+With PROFILING_SLOW_MS set, sampled requests also run under cProfile and
+the slow ones are dumped to PROFILING_DIR (open with pstats/snakeviz).
+
+Stats live in a ContextVar, so work done for the request on another thread
+(asgi_view, sync_to_async) is counted too. cProfile only follows the
+calling thread, requests served over ASGI are not run under it.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.serializers import BaseSerializer
+
+from restaurantBE.utils.async_middleware import AsyncCapableMiddleware
+
+logger = logging.getLogger("restaurantBE.profiling")
+
+_stats = ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    __slots__ = ("queries", "db", "serialize", "render", "_depth")
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.render = 0.0
+        self._depth = 0
+
+
+@contextmanager
+def timed(section):
+    """
+    Add the time spent in the block to section ("serialize" or "render") of
+    the current request, a no-op outside a profiled request.
+    """
+    stats = _stats.get()
+    if stats is None:
+        yield
+        return
+
+    # Nested sections (a serializer inside a serializer) are counted once
+    stats._depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats._depth -= 1
+        if not stats._depth:
+            setattr(stats, section, getattr(stats, section) + time.perf_counter() - started)
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db += time.perf_counter() - started
+
+
+def _install_query_wrapper(sender, connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _install_serializer_timing():
+    # Serializer.data and ListSerializer.data both go through BaseSerializer.data
+    data = BaseSerializer.data.fget
+    if getattr(data, "profiled", False):
+        return
+
+    def profiled_data(self):
+        with timed("serialize"):
+            return data(self)
+
+    profiled_data.profiled = True
+    BaseSerializer.data = property(profiled_data)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+class ProfilingMiddleware(AsyncCapableMiddleware):
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.slow = settings.PROFILING_SLOW_MS / 1000
+        connection_created.connect(_install_query_wrapper)
+        for connection in connections.all():
+            _install_query_wrapper(None, connection)
+        _install_serializer_timing()
+
+    def handle(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = _stats.set(stats)
+        profiler = cProfile.Profile() if self.slow else None
+        started = time.perf_counter()
+        try:
+            if profiler is not None:
+                response = profiler.runcall(self.get_response, request)
+            else:
+                response = self.get_response(request)
+        finally:
+            _stats.reset(token)
+        self.report(request, response, stats, time.perf_counter() - started, profiler)
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= self.sample_rate:
+            return await self.get_response(request)
+
+        stats = RequestStats()
+        token = _stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _stats.reset(token)
+        self.report(request, response, stats, time.perf_counter() - started, None)
+        return response
+
+    def report(self, request, response, stats, elapsed, profiler):
+        size = None if response.streaming else len(response.content)
+        response["Server-Timing"] = (
+            f"app;dur={_ms(elapsed)}, "
+            f'db;dur={_ms(stats.db)};desc="{stats.queries} queries", '
+            f"serialize;dur={_ms(stats.serialize)}, "
+            f"render;dur={_ms(stats.render)}"
+        )
+
+        match = getattr(request, "resolver_match", None)
+        route = match.url_name if match else None
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "route": route,
+                    "status": response.status_code,
+                    "duration_ms": _ms(elapsed),
+                    "db_queries": stats.queries,
+                    "db_ms": _ms(stats.db),
+                    "serialize_ms": _ms(stats.serialize),
+                    "render_ms": _ms(stats.render),
+                    "bytes": size,
+                }
+            )
+        )
+
+        if profiler is not None and elapsed >= self.slow:
+            self.dump_profile(profiler, request, route, elapsed)
+
+    def dump_profile(self, profiler, request, route, elapsed):
+        os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+        name = route or re.sub(r"[^\w]+", "_", request.path).strip("_") or "root"
+        path = os.path.join(
+            settings.PROFILING_DIR,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{request.method}-{name}-{_ms(elapsed):.0f}ms.prof",
+        )
+        profiler.dump_stats(path)
+        logger.warning("Slow request profile written to %s", path)
@@ -0,0 +1,41 @@
+"""
+orjson renderer for the API
+Drop-in for DRF's JSONRenderer with the same compact UTF-8 output.
+datetime/date/time/UUID are encoded natively (UTC as "Z"), lazy
+translation strings and other types go through DRF's JSONEncoder.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from restaurantBE.utils.profiling import timed
+
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_default = JSONEncoder().default
+
+
+def dumps(data, indent=False):
+    """
+    Encode data to JSON bytes.
+    """
+    options = OPTIONS | orjson.OPT_INDENT_2 if indent else OPTIONS
+    content = orjson.dumps(data, default=_default, option=options)
+    # Keep the output a strict javascript subset, as JSONRenderer does
+    if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+        content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+    return content
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        # orjson only indents by 2, any requested indent turns it on
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        with timed("render"):
+            return dumps(data, indent=bool(indent))
@@ -1,12 +1,17 @@
+from itertools import islice
+
 from rest_framework.response import Response
-from django.utils.translation import gettext as _
+
+from restaurantBE.utils.async_views import StreamingResponse
+from restaurantBE.utils.messages import message, stream_head
+from restaurantBE.utils.renderers import dumps
 
 
 def apiSuccess(data=None, msg="success", status=200):
     return Response(
         {
             "success": True,
-            "message": _(msg),
+            "message": message(msg),
             "data": data,
         },
         status=status,
@@ -21,8 +26,41 @@ def apiError(
     return Response(
         {
             "success": False,
-            "message": _(msg),
+            "message": message(msg),
             "errors": errors,
         },
         status=status,
     )
+
+
+def _stream_envelope(head, rows, serialize, chunk_size):
+    yield head
+    # Evaluated here, in the thread that streams the body
+    if hasattr(rows, "iterator"):
+        rows = rows.iterator(chunk_size=chunk_size)
+    rows = iter(rows)
+    separator = b""
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        items = serialize(chunk) if serialize else chunk
+        yield separator + b",".join(dumps(item) for item in items)
+        separator = b","
+    yield b"]}"
+
+
+def apiStream(rows, serialize=None, msg="success", status=200, chunk_size=1000):
+    """
+    apiSuccess for large lists: the {success, message, data} envelope is
+    streamed and data is produced chunk_size rows at a time, querysets are
+    read with iterator(chunk_size). serialize turns a list of rows into a
+    list of JSON-ready items (rows are used as-is when it is None).
+    The status is sent before the rows are read, a failure while streaming
+    cuts the body short.
+    """
+    return StreamingResponse(
+        _stream_envelope(stream_head(msg), rows, serialize, chunk_size),
+        status=status,
+        content_type="application/json",
+    )
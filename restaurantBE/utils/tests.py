@@ -0,0 +1,20 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import translation
+from django.utils.translation import gettext_lazy, pgettext_lazy
+
+from restaurantBE.utils import messages
+
+
+class MessageTests(SimpleTestCase):
+    def test_lazy_msgid_is_memoized(self):
+        msgid = gettext_lazy("uncatalogued_message")
+        with mock.patch.object(translation, "gettext", wraps=translation.gettext) as gettext:
+            messages.message(msgid)
+            messages.message(msgid)
+        self.assertEqual(gettext.call_count, 1)
+        self.assertIn("uncatalogued_message", messages._messages[messages.get_request_language()])
+
+    def test_other_lazy_strings_resolve_themselves(self):
+        self.assertEqual(messages.message(pgettext_lazy("context", "text")), "text")
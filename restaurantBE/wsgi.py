@@ -10,11 +10,24 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/wsgi/
 import os
 from dotenv import load_dotenv
 
+from restaurantBE import startup
+
 # Load environment variables from .env file
 load_dotenv()
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurantBE.settings.production")
 
-application = get_wsgi_application()
+with startup.phase("settings"):
+    settings.INSTALLED_APPS
+
+with startup.phase("django"):
+    application = get_wsgi_application()
+
+startup.warm_up()
+startup.report()
+
+if not startup.preloaded():
+    startup.start_background_tasks()